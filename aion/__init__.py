@@ -8,6 +8,6 @@ __version__ = "0.1.0"
 __author__ = "AION Team"
 
 from .core.interpreter import AIONInterpreter
-from .core.registry import TaskRegistry
+from .core.registry import TaskRegistry, TaskFailure
 
-__all__ = ["AIONInterpreter", "TaskRegistry"]
+__all__ = ["AIONInterpreter", "TaskRegistry", "TaskFailure"]
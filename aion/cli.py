@@ -6,31 +6,75 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Any
 import pandas as pd
 
 from .core.interpreter import AIONInterpreter
+from .tasks.export import write_csv
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 def load_program(file_path: str) -> dict:
     """Load an AION program from a JSON file."""
     try:
+        if orjson is not None:
+            with open(file_path, "rb") as f:
+                return orjson.loads(f.read())
         with open(file_path, "r") as f:
             return json.load(f)
     except FileNotFoundError:
         print(f"Error: File '{file_path}' not found")
         sys.exit(1)
     except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
         print(f"Error: Invalid JSON in '{file_path}': {e}")
         sys.exit(1)
 
 
-def load_data(file_path: str) -> pd.DataFrame:
-    """Load input data from a file."""
-    path = Path(file_path)
+def load_data(file_path: str, engine: str = "pandas", fast_io: bool = False) -> Any:
+    """Load input data from a file.
 
-    if path.suffix.lower() == ".csv":
+    With the polars engine JSON Lines files are scanned lazily, so the
+    program runs over the file as a single streaming query. CSV and JSON
+    files are still read by pandas, since Polars infers their types
+    differently (e.g. ``"60 "`` stays a string), which would change task
+    results; the interpreter hands the frame to Polars itself. With
+    ``fast_io`` pandas parses CSV and JSON Lines with PyArrow's
+    multi-threaded readers into Arrow-backed columns.
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+
+    if engine == "polars":
+        try:
+            import polars as pl
+        except ImportError:
+            print("Error: Polars package not installed. Run: pip install polars")
+            sys.exit(1)
+
+        if suffix == ".jsonl":
+            return pl.scan_ndjson(file_path)
+
+    if fast_io:
+        try:
+            import pyarrow.json as pajson
+        except ImportError:
+            print("Error: PyArrow package not installed. Run: pip install pyarrow")
+            sys.exit(1)
+
+        if suffix == ".csv":
+            return pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
+        elif suffix == ".jsonl":
+            return pajson.read_json(file_path).to_pandas(types_mapper=pd.ArrowDtype)
+        # JSON arrays are not line-delimited; read them with pandas below
+
+    if suffix == ".csv":
         return pd.read_csv(file_path)
-    elif path.suffix.lower() in [".json", ".jsonl"]:
+    elif suffix in [".json", ".jsonl"]:
         return pd.read_json(file_path)
     else:
         print(f"Error: Unsupported file format: {path.suffix}")
@@ -54,6 +98,17 @@ def main():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed execution logs"
     )
+    parser.add_argument(
+        "--fast-io",
+        action="store_true",
+        help="Parse input with PyArrow into Arrow-backed columns (pandas engine)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=AIONInterpreter.BACKENDS,
+        default="pandas",
+        help="Execution engine; 'polars' scans input lazily (default: pandas)",
+    )
 
     args = parser.parse_args()
 
@@ -62,7 +117,7 @@ def main():
 
     # Explain mode
     if args.explain:
-        interpreter = AIONInterpreter()
+        interpreter = AIONInterpreter(backend=args.engine)
         explanation = interpreter.explain(program)
         print(explanation)
         return
@@ -70,10 +125,10 @@ def main():
     # Load input data
     input_data = None
     if args.input:
-        input_data = load_data(args.input)
+        input_data = load_data(args.input, args.engine, args.fast_io)
 
     # Execute program
-    interpreter = AIONInterpreter()
+    interpreter = AIONInterpreter(backend=args.engine)
     result = interpreter.execute(program, input_data)
 
     # Handle errors
@@ -104,7 +159,7 @@ def main():
             if args.output:
                 output_path = Path(args.output)
                 if output_path.suffix.lower() == ".csv":
-                    result.data.to_csv(args.output, index=False)
+                    write_csv(result.data, args.output)
                 elif output_path.suffix.lower() == ".json":
                     result.data.to_json(args.output, orient="records", indent=2)
                 else:
@@ -2,16 +2,38 @@
 AION interpreter for executing AION programs.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+from collections import OrderedDict
+import json
 import logging
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
-from .registry import TaskRegistry
-from .validators import AIONValidator
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+from .registry import TaskRegistry, TaskFailure
+from .validators import AIONValidator, TypedTask, type_task
+from . import lazy
+from .jit_fuser import fuse_numeric_pipeline
 
 logger = logging.getLogger(__name__)
 
+# Programs remembered per interpreter by the validation and plan caches
+PROGRAM_CACHE_SIZE = 128
+
+# Planned task index groups and pruned task indices of one program
+_Plan = Tuple[List[Tuple[int, ...]], FrozenSet[int]]
+_PlanKey = Tuple[bytes, FrozenSet[str], FrozenSet[Any]]
+
 
 @dataclass
 class ExecutionResult:
@@ -23,16 +45,13 @@ class ExecutionResult:
     execution_plan: List[Dict[str, Any]]
 
 
-class AIONInterpreter:
-    """Interpreter for AION programs."""
+_DEFAULT_REGISTRY: Optional[TaskRegistry] = None
 
-    def __init__(self):
-        self.registry = TaskRegistry()
-        self.validator = AIONValidator()
-        self._register_default_tasks()
 
-    def _register_default_tasks(self):
-        """Register the default task handlers."""
+def _get_default_registry() -> TaskRegistry:
+    """Registry with the default task handlers, built once per process."""
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
         from ..tasks import (
             filter_task,
             sort_task,
@@ -42,12 +61,298 @@ class AIONInterpreter:
             export_task,
         )
 
-        self.registry.register("filter", filter_task)
-        self.registry.register("sort", sort_task)
-        self.registry.register("transform", transform_task)
-        self.registry.register("model_call", model_call_task)
-        self.registry.register("aggregate", aggregate_task)
-        self.registry.register("export", export_task)
+        registry = TaskRegistry()
+        registry.register("filter", filter_task)
+        registry.register("sort", sort_task)
+        registry.register("transform", transform_task)
+        registry.register("model_call", model_call_task)
+        registry.register("aggregate", aggregate_task)
+        registry.register("export", export_task)
+        _DEFAULT_REGISTRY = registry
+    return _DEFAULT_REGISTRY
+
+
+def _program_key(program: Dict[str, Any]) -> Optional[bytes]:
+    """Serialize a program to its canonical JSON form.
+
+    The bytes themselves are the cache key, so distinct programs never
+    share an entry. Returns None for programs that are not
+    JSON-serializable; those are simply not cached.
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(program, option=orjson.OPT_SORT_KEYS)
+        return json.dumps(program, sort_keys=True).encode()
+    except (TypeError, ValueError):
+        return None
+
+
+def _cache_put(cache: "OrderedDict[Any, Any]", key: Any, value: Any) -> None:
+    """Store ``value`` in an LRU cache, evicting the oldest entries."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > PROGRAM_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _to_arrow_strings(data: Any) -> Any:
+    """Convert a DataFrame's object string columns to Arrow strings.
+
+    Numeric columns keep their NumPy dtypes, which the filter, sort and
+    aggregate fast paths rely on. Object columns holding anything other
+    than strings are left as they are.
+    """
+    if pyarrow is None:
+        logger.warning("PyArrow not installed, keeping NumPy-backed strings")
+        return data
+    if not isinstance(data, pd.DataFrame) or data.empty:
+        return data
+
+    positions = [
+        position
+        for position in np.flatnonzero((data.dtypes == object).to_numpy())
+        if pd.api.types.infer_dtype(data.iloc[:, position], skipna=True) == "string"
+    ]
+    if not positions:
+        return data
+
+    converted = data.iloc[:, positions].convert_dtypes(dtype_backend="pyarrow")
+    result = data.copy(deep=False)
+    for position, (_, column) in zip(positions, converted.items()):
+        result.isetitem(position, column)
+    return result
+
+
+def _builtin_task_types(registry: TaskRegistry) -> FrozenSet[str]:
+    """Task types whose handler is still the built-in one.
+
+    The pipeline optimizer relies on the built-in handlers' semantics, so
+    it leaves tasks with user-registered handlers where they are.
+    """
+    defaults = _get_default_registry()._handlers
+    return frozenset(
+        task_type
+        for task_type, handler in registry._handlers.items()
+        if defaults.get(task_type) is handler
+    )
+
+
+def _filter_commutes(task: Dict[str, Any], sortable: FrozenSet[Any]) -> bool:
+    """Check whether a filter can run before ``task``.
+
+    Filters only commute with sorts whose field is in the input. Handlers
+    return empty input unchanged, so a filter that removes every row must
+    not run first: a transform's new fields and dropped sources would be
+    lost, and a sort on a missing field would no longer report it.
+    """
+    return task["task"] == "sort" and task["operation"]["field"] in sortable
+
+
+def _sortable_fields(pipeline: List[Dict[str, Any]], columns: Any) -> FrozenSet[Any]:
+    """Sort fields of the pipeline that are columns of its input."""
+    return frozenset(
+        task["operation"]["field"]
+        for task in pipeline
+        if task["task"] == "sort" and task["operation"]["field"] in columns
+    )
+
+
+def _plan_pipeline(
+    pipeline: List[Dict[str, Any]], builtin: FrozenSet[str], sortable: FrozenSet[Any]
+) -> List[Tuple[int, ...]]:
+    """Plan a validated pipeline so it does less work.
+
+    Filters are pushed upstream past the sorts they commute with, so
+    later tasks run on fewer rows. Runs of adjacent filters on the same
+    engine are then grouped to be fused into one filter that ANDs their
+    masks and selects rows once. Only tasks with built-in handlers
+    are moved, and only within the leading run of filters and sorts,
+    where the columns are still those of the input.
+
+    Args:
+        pipeline: List of validated task configurations
+        builtin: Task types that use the built-in handlers
+        sortable: Sort fields that are columns of the input
+
+    Returns:
+        Groups of original task indices in execution order
+    """
+    if "filter" not in builtin:
+        return [(i,) for i in range(len(pipeline))]
+
+    limit = next(
+        (
+            i
+            for i, task in enumerate(pipeline)
+            if task["task"] not in ("filter", "sort") or task["task"] not in builtin
+        ),
+        len(pipeline),
+    )
+
+    order = list(enumerate(pipeline))
+    for pos in range(1, limit):
+        task = order[pos][1]
+        if task["task"] != "filter":
+            continue
+
+        j = pos
+        while (
+            j > 0
+            and order[j - 1][1]["task"] in builtin
+            and _filter_commutes(order[j - 1][1], sortable)
+        ):
+            order[j - 1], order[j] = order[j], order[j - 1]
+            j -= 1
+
+    groups: List[Tuple[int, ...]] = []
+    for i, task in order:
+        if task["task"] == "filter" and groups:
+            previous = pipeline[groups[-1][0]]
+            if previous["task"] == "filter" and previous.get("engine") == task.get(
+                "engine"
+            ):
+                groups[-1] += (i,)
+                continue
+        groups.append((i,))
+
+    return groups
+
+
+def _prune_pipeline(
+    pipeline: List[Dict[str, Any]], builtin: FrozenSet[str]
+) -> FrozenSet[int]:
+    """Find built-in tasks that cannot affect the pipeline's result.
+
+    These are transforms with an empty mapping, and sorts immediately
+    followed by another sort on the same field, whose order the second
+    sort replaces. Pruned tasks still appear in logs and the execution
+    plan, but run as no-ops.
+
+    Returns:
+        Indices of the tasks to skip
+    """
+    pruned = set()
+    for i, task in enumerate(pipeline):
+        if task["task"] not in builtin:
+            continue
+        if task["task"] == "transform" and not task["mapping"]:
+            pruned.add(i)
+        elif (
+            task["task"] == "sort"
+            and i + 1 < len(pipeline)
+            and pipeline[i + 1]["task"] == "sort"
+            and pipeline[i + 1]["operation"]["field"] == task["operation"]["field"]
+        ):
+            pruned.add(i)
+    return frozenset(pruned)
+
+
+def _skip_task(data: Any, task: Dict[str, Any]) -> Any:
+    """Handler for pruned tasks."""
+    return data
+
+
+def _bind_plan(
+    pipeline: List[Dict[str, Any]], groups: List[Tuple[int, ...]]
+) -> List[Tuple[Tuple[int, ...], Dict[str, Any]]]:
+    """Pair each planned group with the task to run for it.
+
+    Groups of several filters become one filter whose condition ANDs
+    theirs. Tasks come from ``pipeline``, so a cached plan can be bound to
+    any program with the same structure.
+
+    Returns:
+        ``(original_indices, task)`` pairs in execution order
+    """
+    bound = []
+    for indices in groups:
+        task = pipeline[indices[0]]
+        if len(indices) > 1:
+            conditions = [pipeline[i]["condition"] for i in indices]
+            task = dict(task, condition={"op": "and", "conditions": conditions})
+        bound.append((indices, task))
+    return bound
+
+
+def _explain_filter(task: TypedTask) -> str:
+    """Describe a filter task."""
+    return f"   - Filters data where {task.field} {task.operator} {task.value}\n"
+
+
+def _explain_sort(task: TypedTask) -> str:
+    """Describe a sort task."""
+    return f"   - Sorts data by {task.field} in {task.order}ending order\n"
+
+
+def _explain_transform(task: TypedTask) -> str:
+    """Describe a transform task."""
+    return f"   - Transforms fields: {list(task.mapping.keys())}\n"
+
+
+def _explain_model_call(task: TypedTask) -> str:
+    """Describe a model_call task."""
+    return f"   - Calls AI model with prompt: {task.prompt[:50]}...\n"
+
+
+def _explain_default(task: TypedTask) -> str:
+    """Task types without extra details."""
+    return ""
+
+
+# Functions describing each task's configuration, indexed by TaskType
+_EXPLAINERS = (
+    _explain_filter,
+    _explain_sort,
+    _explain_transform,
+    _explain_model_call,
+    _explain_default,
+    _explain_default,
+)
+
+
+class AIONInterpreter:
+    """Interpreter for AION programs."""
+
+    BACKENDS = ("pandas", "polars")
+
+    def __init__(
+        self,
+        backend: str = "pandas",
+        use_arrow: bool = False,
+        fuse_numeric: bool = False,
+    ):
+        """Create an interpreter.
+
+        Args:
+            backend: Execution backend, either 'pandas' (eager, task by task)
+                or 'polars' (lazy query plan collected once, falling back to
+                pandas for tasks it cannot lower)
+            use_arrow: Convert object string columns of pandas input to
+                Arrow-backed strings before running, so comparisons, sorts
+                and string operations use Arrow's compute kernels. Requires
+                pyarrow and pandas>=2.0
+            fuse_numeric: Run pipelines made only of numeric comparison
+                filters and renames as one compiled Numba kernel on frames
+                of at least ``jit_fuser.MIN_ROWS`` rows. Each new pipeline
+                shape pays a JIT compile per process, so this only helps
+                when the same pipeline runs many times
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown backend: {backend}. Valid backends: {self.BACKENDS}"
+            )
+
+        self.backend = backend
+        self.use_arrow = use_arrow
+        self.fuse_numeric = fuse_numeric
+        self.registry = _get_default_registry().copy()
+        self.validator = AIONValidator()
+        # Program key -> typed pipeline of programs that passed validation,
+        # least recently used first
+        self._typed: "OrderedDict[bytes, List[TypedTask]]" = OrderedDict()
+        # (program key, built-in task types, sortable fields) -> planned task
+        # index groups and pruned task indices, least recently used first
+        self._plans: "OrderedDict[_PlanKey, _Plan]" = OrderedDict()
 
     def execute(
         self, program: Dict[str, Any], input_data: Optional[Any] = None
@@ -56,7 +361,10 @@ class AIONInterpreter:
 
         Args:
             program: The AION program to execute
-            input_data: Input data (defaults to empty DataFrame)
+            input_data: Input data (defaults to empty DataFrame, returned
+                as pandas for an empty pipeline). With the
+                polars backend this may also be a polars DataFrame or
+                LazyFrame, e.g. from ``polars.scan_csv``
 
         Returns:
             ExecutionResult with data, logs, errors, and execution plan
@@ -65,14 +373,33 @@ class AIONInterpreter:
         errors: List[str] = []
         execution_plan: List[Dict[str, Any]] = []
 
-        # Validate the program
-        validation_errors = self.validator.validate_program(program)
-        if validation_errors:
-            errors.extend([f"{e.path}: {e.message}" for e in validation_errors])
+        # Nothing to do for an empty pipeline, which is always valid
+        pipeline = program.get("pipeline")
+        if isinstance(pipeline, list) and not pipeline:
+            logs.append("Program validation passed")
             return ExecutionResult(
-                data=None, logs=logs, errors=errors, execution_plan=[]
+                data=(
+                    pd.DataFrame() if input_data is None else lazy.to_pandas(input_data)
+                ),
+                logs=logs,
+                errors=errors,
+                execution_plan=[],
             )
 
+        # Validate the program, unless an identical one already passed
+        key = _program_key(program)
+        if key is not None and key in self._typed:
+            self._typed.move_to_end(key)
+        else:
+            validation_errors, typed = self.validator.compile_program(program)
+            if validation_errors:
+                errors.extend([f"{e.path}: {e.message}" for e in validation_errors])
+                return ExecutionResult(
+                    data=None, logs=logs, errors=errors, execution_plan=[]
+                )
+            if key is not None:
+                _cache_put(self._typed, key, typed)
+
         # Initialize data
         if input_data is None:
             data = pd.DataFrame()
@@ -81,57 +408,201 @@ class AIONInterpreter:
 
         logs.append("Program validation passed")
 
+        builtin = _builtin_task_types(self.registry)
+
+        # Try the lazy backend first; any task it cannot lower falls back
+        # to the eager pandas path below
+        if self.backend == "polars":
+            lazy_data = self._execute_lazy(pipeline, data, builtin)
+            if lazy_data is not None:
+                logs.append(f"Executed {len(pipeline)} tasks as one polars query")
+                return ExecutionResult(
+                    data=lazy_data,
+                    logs=logs,
+                    errors=errors,
+                    execution_plan=self._fused_plan(pipeline),
+                )
+            logs.append("Pipeline not supported by polars backend, using pandas")
+
+        data = lazy.to_pandas(data)
+        if self.use_arrow:
+            data = _to_arrow_strings(data)
+
+        # Opt-in: numeric filter/rename chains run as one fused Numba
+        # kernel, as long as the filter and transform handlers are built-in
+        fused = None
+        if self.fuse_numeric and {"filter", "transform"} <= builtin:
+            fused = fuse_numeric_pipeline(pipeline)
+        if fused is not None and fused.can_run(data):
+            try:
+                fused_data = fused.run(data, self.registry.get_handler("transform"))
+                if fused_data is not None:
+                    logs.append(f"Executed {len(pipeline)} tasks as one fused kernel")
+                    return ExecutionResult(
+                        data=fused_data,
+                        logs=logs,
+                        errors=errors,
+                        execution_plan=self._fused_plan(pipeline),
+                    )
+            except Exception as e:
+                logger.info(f"Fused kernel failed, running tasks one by one: {e}")
+
+        # Run filters early and fused; plan entries keep each task's index
+        # in the program. Plans are cached per program, set of built-in
+        # handlers and sort fields found in the input, which decide what
+        # may move
+        sortable = _sortable_fields(pipeline, data.columns)
+        plan_key = (key, builtin, sortable)
+        cached = self._plans.get(plan_key) if key is not None else None
+        if cached is not None:
+            self._plans.move_to_end(plan_key)
+        else:
+            cached = (
+                _plan_pipeline(pipeline, builtin, sortable),
+                _prune_pipeline(pipeline, builtin),
+            )
+            if key is not None:
+                _cache_put(self._plans, plan_key, cached)
+        groups, pruned = cached
+        ordered = _bind_plan(pipeline, groups)
+
+        # Resolve handlers up front and bind hot-loop methods to locals
+        handlers = self.registry._handlers
+        pending = [
+            (
+                indices,
+                task,
+                _skip_task if indices[0] in pruned else handlers.get(task["task"]),
+            )
+            for indices, task in reversed(ordered)
+        ]
+        log = logs.append
+        plan = execution_plan.append
+        n_tasks = len(pipeline)
+
         # Execute pipeline
-        pipeline = program["pipeline"]
-        for i, task in enumerate(pipeline):
+        while pending:
+            indices, task, handler = pending.pop()
             task_type = task["task"]
-            logs.append(f"Executing task {i+1}/{len(pipeline)}: {task_type}")
+            steps = ", ".join(str(i + 1) for i in indices)
+            log(f"Executing task {steps}/{n_tasks}: {task_type}")
+
+            if handler is None:
+                error_msg = f"No handler registered for task type: {task_type}"
+                errors.append(error_msg)
+                log(f"ERROR: {error_msg}")
+                break
 
+            # Execute task; handlers return TaskFailure for known failure
+            # modes and only unexpected errors are raised
             try:
-                # Get task handler
-                handler = self.registry.get_handler(task_type)
-                if handler is None:
-                    error_msg = f"No handler registered for task type: {task_type}"
-                    errors.append(error_msg)
-                    logs.append(f"ERROR: {error_msg}")
-                    break
-
-                # Execute task
                 result = handler(data, task)
-                data = result
+            except Exception as e:
+                result = TaskFailure(str(e))
+
+            if isinstance(result, TaskFailure) and len(indices) > 1:
+                # Re-run fused filters one by one to report the failing one
+                pending.extend(((i,), pipeline[i], handler) for i in reversed(indices))
+                continue
+
+            if isinstance(result, TaskFailure):
+                error_msg = f"Task {task_type} failed: {result.message}"
+                errors.append(error_msg)
+                log(f"ERROR: {error_msg}")
 
-                # Record execution
-                execution_plan.append(
+                plan(
                     {
-                        "task_index": i,
+                        "task_index": indices[0],
                         "task_type": task_type,
                         "task_config": task,
-                        "success": True,
+                        "success": False,
+                        "error": result.message,
                     }
                 )
+                break
 
-                logs.append(f"Task {task_type} completed successfully")
-
-            except Exception as e:
-                error_msg = f"Task {task_type} failed: {str(e)}"
-                errors.append(error_msg)
-                logs.append(f"ERROR: {error_msg}")
+            data = result
 
-                execution_plan.append(
+            # Record execution
+            for i in indices:
+                plan(
                     {
                         "task_index": i,
                         "task_type": task_type,
-                        "task_config": task,
-                        "success": False,
-                        "error": str(e),
+                        "task_config": pipeline[i],
+                        "success": True,
                     }
                 )
-                break
+
+            log(f"Task {task_type} completed successfully")
 
         return ExecutionResult(
             data=data, logs=logs, errors=errors, execution_plan=execution_plan
         )
 
+    def _fused_plan(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execution plan for a pipeline that ran as a single fused step."""
+        return [
+            {
+                "task_index": i,
+                "task_type": task["task"],
+                "task_config": task,
+                "success": True,
+            }
+            for i, task in enumerate(pipeline)
+        ]
+
+    def _to_lazy(
+        self, pipeline: List[Dict[str, Any]], data: Any, builtin: FrozenSet[str]
+    ) -> Optional[Any]:
+        """Translate the pipeline into a Polars LazyFrame over ``data``.
+
+        Tasks with user-registered handlers must run through the registry,
+        so such pipelines stay on the pandas path.
+        """
+        if any(task["task"] not in builtin for task in pipeline):
+            return None
+
+        if not lazy.polars_available():
+            logger.warning("Polars not installed, using pandas backend")
+            return None
+
+        if isinstance(data, lazy.pl.LazyFrame):
+            lf = data
+        elif isinstance(data, lazy.pl.DataFrame):
+            lf = data.lazy()
+        elif isinstance(data, pd.DataFrame) and not data.empty:
+            lf = lazy.pl.from_pandas(data).lazy()
+        else:
+            return None
+
+        return lazy.to_lazy(pipeline, lf)
+
+    def _execute_lazy(
+        self, pipeline: List[Dict[str, Any]], data: Any, builtin: FrozenSet[str]
+    ) -> Optional[pd.DataFrame]:
+        """Run the pipeline as a single Polars query.
+
+        Returns:
+            Resulting pandas DataFrame, or None if the pipeline has to run
+            on the pandas backend instead
+        """
+        try:
+            lf = self._to_lazy(pipeline, data, builtin)
+            if lf is None:
+                return None
+            result = lf.collect(engine="streaming")
+            if result.is_empty():
+                # The pandas handlers return empty input unchanged instead
+                # of the computed schema
+                return None
+            return result.to_pandas()
+        except Exception as e:
+            # Type mismatches etc. only surface at collect time; the pandas
+            # path reports them against the task that caused them
+            logger.info(f"Polars execution failed, falling back to pandas: {e}")
+            return None
+
     def explain(self, program: Dict[str, Any]) -> str:
         """Generate a human-readable explanation of an AION program.
 
@@ -145,33 +616,19 @@ class AIONInterpreter:
             return "Invalid program: missing pipeline"
 
         pipeline = program["pipeline"]
-        explanation = f"This AION program contains {len(pipeline)} tasks:\n\n"
-
-        for i, task in enumerate(pipeline):
-            task_type = task["task"]
-            explanation += f"{i+1}. **{task_type.upper()}** task\n"
-
-            if task_type == "filter":
-                condition = task.get("condition", {})
-                field = condition.get("field", "unknown")
-                operator = condition.get("operator", "unknown")
-                value = condition.get("value", "unknown")
-                explanation += f"   - Filters data where {field} {operator} {value}\n"
-
-            elif task_type == "sort":
-                operation = task.get("operation", {})
-                field = operation.get("field", "unknown")
-                order = operation.get("order", "asc")
-                explanation += f"   - Sorts data by {field} in {order}ending order\n"
-
-            elif task_type == "transform":
-                mapping = task.get("mapping", {})
-                explanation += f"   - Transforms fields: {list(mapping.keys())}\n"
-
-            elif task_type == "model_call":
-                prompt = task.get("prompt", "unknown")
-                explanation += f"   - Calls AI model with prompt: {prompt[:50]}...\n"
-
-            explanation += "\n"
-
-        return explanation
+        parts = [f"This AION program contains {len(pipeline)} tasks:\n\n"]
+        append = parts.append
+
+        # Reuse the typed pipeline built while validating for execute();
+        # programs that were never executed are flattened here
+        typed = self._typed.get(_program_key(program))
+        if typed is None:
+            typed = [type_task(task) for task in pipeline]
+
+        for i, task in enumerate(typed):
+            append(f"{i+1}. **{task.task_type.upper()}** task\n")
+            explainer = _explain_default if task.tag is None else _EXPLAINERS[task.tag]
+            append(explainer(task))
+            append("\n")
+
+        return "".join(parts)
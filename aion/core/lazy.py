@@ -0,0 +1,267 @@
+"""
+Lazy Polars execution backend for AION pipelines.
+
+Each supported task type has a builder that appends its operation to a
+``polars.LazyFrame`` query plan instead of materializing an intermediate
+DataFrame. The whole plan is collected once, letting the Polars optimizer
+apply predicate/projection pushdown and common subexpression elimination
+across tasks.
+"""
+
+from typing import Dict, Any, List, Callable, Optional
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None
+
+from ..tasks.transform import _is_literal
+
+
+def polars_available() -> bool:
+    """Check whether the Polars backend can be used."""
+    return pl is not None
+
+
+def to_pandas(data: Any) -> Any:
+    """Materialize Polars input as a pandas DataFrame for the eager path."""
+    if pl is not None and isinstance(data, pl.LazyFrame):
+        data = data.collect(engine="streaming")
+    if pl is not None and isinstance(data, pl.DataFrame):
+        return data.to_pandas()
+    return data
+
+
+def _filter_expr(column: Any, op_str: str, value: Any) -> Optional[Any]:
+    """Build a Polars predicate expression for a filter operator."""
+    if op_str == "==":
+        return column == value
+    if op_str == "!=":
+        # pandas keeps missing values, since NaN compares unequal to anything
+        return (column != value) | column.is_null()
+    if op_str == ">":
+        return column > value
+    if op_str == ">=":
+        return column >= value
+    if op_str == "<":
+        return column < value
+    if op_str == "<=":
+        return column <= value
+    if op_str == "in":
+        return column.is_in(value)
+    if op_str == "not in":
+        return ~column.is_in(value)
+    if op_str == "contains":
+        return column.str.contains(value)
+    if op_str == "startswith":
+        return column.str.starts_with(value)
+    if op_str == "endswith":
+        return column.str.ends_with(value)
+    return None
+
+
+def _lower_filter(lf: Any, task: Dict[str, Any], columns: List[str]) -> Optional[Any]:
+    """Lower a filter task to ``LazyFrame.filter``."""
+    condition = task["condition"]
+    field = condition["field"]
+    if field not in columns:
+        return None
+
+    expr = _filter_expr(pl.col(field), condition["operator"], condition["value"])
+    if expr is None:
+        return None
+
+    return lf.filter(expr)
+
+
+def _lower_sort(lf: Any, task: Dict[str, Any], columns: List[str]) -> Optional[Any]:
+    """Lower a sort task to ``LazyFrame.sort``."""
+    operation = task["operation"]
+    field = operation["field"]
+    if field not in columns:
+        return None
+
+    descending = operation.get("order", "asc").lower() == "desc"
+    return lf.sort(field, descending=descending, nulls_last=True)
+
+
+def _lower_transform(
+    lf: Any, task: Dict[str, Any], columns: List[str]
+) -> Optional[Any]:
+    """Lower a transform task to ``LazyFrame.with_columns``.
+
+    Like the pandas handler, every new field is computed from the input
+    columns and renamed sources are dropped afterwards.
+    """
+    schema = lf.collect_schema()
+    exprs = []
+    fields_to_remove = []
+
+    for new_field, source in task["mapping"].items():
+        if isinstance(source, str):
+            if source not in columns:
+                return None
+            exprs.append(pl.col(source).alias(new_field))
+            fields_to_remove.append(source)
+
+        elif isinstance(source, dict) and "concat" not in source:
+            expr = _arithmetic_expr(source, columns)
+            if expr is None:
+                return None
+            exprs.append(expr.alias(new_field))
+
+        elif isinstance(source, dict):
+            if not isinstance(source["concat"], list):
+                return None
+
+            parts = []
+            for field in source["concat"]:
+                if isinstance(field, str) and field in columns:
+                    parts.append(_concat_part(pl.col(field), schema[field]))
+                else:
+                    # Literal detection stays with the pandas handler, which
+                    # reports unknown fields; only lower exact literals here.
+                    if isinstance(field, str) and not _is_literal(field):
+                        return None
+                    parts.append(pl.lit(str(field)))
+            exprs.append(pl.concat_str(parts).alias(new_field))
+
+        else:
+            exprs.append(pl.lit(source).alias(new_field))
+
+    if exprs:
+        lf = lf.with_columns(exprs)
+    if fields_to_remove:
+        lf = lf.drop(list(dict.fromkeys(fields_to_remove)))
+    return lf
+
+
+_ARITHMETIC: Dict[str, Callable[[Any, Any], Any]] = {
+    "add": lambda a, b: a + b,
+    "sub": lambda a, b: a - b,
+    "mul": lambda a, b: a * b,
+    "div": lambda a, b: a / b,
+}
+
+
+def _arithmetic_expr(spec: Any, columns: List[str]) -> Optional[Any]:
+    """Build a Polars expression for a transform's arithmetic expression tree.
+
+    Returns None for anything the pandas handler should validate or report,
+    such as missing fields or malformed operators.
+    """
+    if isinstance(spec, dict):
+        if len(spec) != 1:
+            return None
+        name, operands = next(iter(spec.items()))
+        if name not in _ARITHMETIC or not isinstance(operands, list):
+            return None
+        if len(operands) < 2:
+            return None
+
+        exprs = [_arithmetic_expr(operand, columns) for operand in operands]
+        if any(expr is None for expr in exprs):
+            return None
+        expr = exprs[0]
+        for operand in exprs[1:]:
+            expr = _ARITHMETIC[name](expr, operand)
+        return expr
+
+    if isinstance(spec, str):
+        return pl.col(spec) if spec in columns else None
+
+    if isinstance(spec, (int, float)) and not isinstance(spec, bool):
+        return pl.lit(spec)
+
+    return None
+
+
+def _concat_part(column: Any, dtype: Any) -> Any:
+    """Stringify a concat column the way pandas' ``astype(str)`` does."""
+    if dtype == pl.Boolean:
+        return (
+            pl.when(column)
+            .then(pl.lit("True"))
+            .when(~column)
+            .then(pl.lit("False"))
+            .otherwise(None)
+        )
+    return column.cast(pl.Utf8)
+
+
+_AGGREGATIONS: Dict[str, Callable[[Any], Any]] = {
+    "sum": lambda c: c.sum(),
+    "mean": lambda c: c.mean(),
+    "min": lambda c: c.min(),
+    "max": lambda c: c.max(),
+    "count": lambda c: c.count().cast(pl.Int64),
+    "median": lambda c: c.median(),
+    "std": lambda c: c.std(),
+    "var": lambda c: c.var(),
+    # pandas skips missing values in first/last/nunique and counts as int64
+    "first": lambda c: c.drop_nulls().first(),
+    "last": lambda c: c.drop_nulls().last(),
+    "nunique": lambda c: c.drop_nulls().n_unique().cast(pl.Int64),
+}
+
+
+def _lower_aggregate(
+    lf: Any, task: Dict[str, Any], columns: List[str]
+) -> Optional[Any]:
+    """Lower an aggregate task to ``LazyFrame.group_by().agg()``.
+
+    Only single-function aggregations are lowered; list specs produce
+    pandas MultiIndex columns and stay on the pandas path.
+    """
+    group_by = task["group_by"]
+    aggregations = task["aggregations"]
+    if not group_by or not aggregations:
+        return None
+
+    for field in list(group_by) + list(aggregations.keys()):
+        if field not in columns:
+            return None
+
+    exprs = []
+    for field, func in aggregations.items():
+        if not isinstance(func, str) or func not in _AGGREGATIONS:
+            return None
+        exprs.append(_AGGREGATIONS[func](pl.col(field)))
+
+    # Match pandas: null keys are dropped, groups keep first-appearance order
+    return (
+        lf.drop_nulls(subset=group_by)
+        .group_by(group_by, maintain_order=True)
+        .agg(exprs)
+    )
+
+
+LAZY_BUILDERS: Dict[str, Callable[[Any, Dict[str, Any], List[str]], Optional[Any]]] = {
+    "filter": _lower_filter,
+    "sort": _lower_sort,
+    "transform": _lower_transform,
+    "aggregate": _lower_aggregate,
+}
+
+
+def to_lazy(pipeline: List[Dict[str, Any]], lf: Any) -> Optional[Any]:
+    """Translate a validated pipeline into a single Polars query plan.
+
+    Args:
+        pipeline: List of validated task configurations
+        lf: Input ``polars.LazyFrame``
+
+    Returns:
+        LazyFrame for the whole pipeline, or None if any task cannot be
+        lowered (unknown task type, missing column, unsupported option)
+    """
+    for task in pipeline:
+        builder = LAZY_BUILDERS.get(task["task"])
+        if builder is None:
+            return None
+
+        lf = builder(lf, task, lf.collect_schema().names())
+        if lf is None:
+            return None
+
+    return lf
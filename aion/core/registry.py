@@ -2,14 +2,30 @@
 Task registry for mapping AION task types to their handler functions.
 """
 
-from typing import Dict, Callable, Any, Optional
+from typing import Dict, Callable, Any, Optional, NamedTuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class TaskFailure(NamedTuple):
+    """Known, recoverable task failure (e.g. a missing column).
+
+    Handlers return this instead of raising so the interpreter can report
+    the failure without unwinding through an exception.
+    """
+
+    message: str
+
+
 class TaskRegistry:
-    """Registry for AION task handlers."""
+    """Registry for AION task handlers.
+
+    The interpreter reads ``_handlers`` directly when resolving a pipeline's
+    handlers, so it must stay a plain task type -> handler dict.
+    """
+
+    __slots__ = ("_handlers", "_metadata")
 
     def __init__(self):
         self._handlers: Dict[str, Callable] = {}
@@ -32,6 +48,13 @@ class TaskRegistry:
         self._metadata[task_type] = metadata or {}
         logger.info(f"Registered task handler for '{task_type}'")
 
+    def copy(self) -> "TaskRegistry":
+        """Return an independent registry with the same handlers."""
+        registry = TaskRegistry()
+        registry._handlers = dict(self._handlers)
+        registry._metadata = dict(self._metadata)
+        return registry
+
     def get_handler(self, task_type: str) -> Optional[Callable]:
         """Get the handler for a task type."""
         return self._handlers.get(task_type)
@@ -2,11 +2,22 @@
 Schema validation for AION programs.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
+from enum import IntEnum
+import sys
 
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
 
-@dataclass
+
+# dataclass(slots=True) requires Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ValidationError:
     """Represents a validation error."""
 
@@ -15,19 +26,180 @@ class ValidationError:
     value: Any = None
 
 
+class TaskType(IntEnum):
+    """Integer tags for the built-in task types, used to index dispatch tables."""
+
+    FILTER = 0
+    SORT = 1
+    TRANSFORM = 2
+    MODEL_CALL = 3
+    AGGREGATE = 4
+    EXPORT = 5
+
+
+# Task type name -> tag; names are interned so lookups with interned
+# strings short-circuit on identity
+TASK_TAGS: Dict[str, TaskType] = {sys.intern(t.name.lower()): t for t in TaskType}
+
+VALID_TASK_TYPES = frozenset(TASK_TAGS)
+
+
+class TypedTask(NamedTuple):
+    """Flattened view of a task's configuration.
+
+    Fields the task type does not use are None. Missing values of used
+    fields get the placeholders ``explain`` shows for incomplete programs.
+    """
+
+    tag: Optional[TaskType]
+    task_type: str
+    field: Any = None
+    operator: Any = None
+    value: Any = None
+    order: Any = None
+    mapping: Any = None
+    prompt: Any = None
+
+
+def type_task(task: Dict[str, Any]) -> TypedTask:
+    """Flatten a task dict into a TypedTask."""
+    task_type = task["task"]
+    tag = TASK_TAGS.get(task_type)
+
+    if tag is TaskType.FILTER:
+        condition = task.get("condition", {})
+        return TypedTask(
+            tag,
+            task_type,
+            field=condition.get("field", "unknown"),
+            operator=condition.get("operator", "unknown"),
+            value=condition.get("value", "unknown"),
+        )
+    if tag is TaskType.SORT:
+        operation = task.get("operation", {})
+        return TypedTask(
+            tag,
+            task_type,
+            field=operation.get("field", "unknown"),
+            order=operation.get("order", "asc"),
+        )
+    if tag is TaskType.TRANSFORM:
+        return TypedTask(tag, task_type, mapping=task.get("mapping", {}))
+    if tag is TaskType.MODEL_CALL:
+        return TypedTask(tag, task_type, prompt=task.get("prompt", "unknown"))
+    return TypedTask(tag, task_type)
+
+
+_VALID_TYPES_STR = ", ".join(sorted(VALID_TASK_TYPES))
+
+# JSON schemas for each task type. Together with STRICT_TYPE_FIELDS they
+# are at least as strict as the hand-written checks below, so a task that
+# passes them is valid; tasks that fail fall through to the checks that
+# build the errors.
+TASK_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "filter": {
+        "type": "object",
+        "required": ["condition"],
+        "properties": {
+            "condition": {
+                "type": "object",
+                "required": ["field", "operator", "value"],
+            },
+            "engine": {"enum": ["pandas", "numba"]},
+        },
+    },
+    "sort": {
+        "type": "object",
+        "required": ["operation"],
+        "properties": {
+            "operation": {
+                "type": "object",
+                "required": ["field"],
+                "properties": {"order": {"enum": ["asc", "desc"]}},
+            }
+        },
+    },
+    "transform": {
+        "type": "object",
+        "required": ["mapping"],
+        "properties": {"mapping": {"type": "object"}},
+    },
+    "model_call": {
+        "type": "object",
+        "required": ["prompt"],
+        "properties": {
+            "max_concurrency": {"type": "integer", "minimum": 1},
+            "batch_size": {"type": "integer", "minimum": 1},
+        },
+    },
+    "aggregate": {
+        "type": "object",
+        "required": ["group_by", "aggregations"],
+        "properties": {
+            "group_by": {"type": "array"},
+            "aggregations": {"type": "object"},
+            "engine": {"enum": ["cython", "numba"]},
+        },
+    },
+    "export": {
+        "type": "object",
+        "required": ["file_path"],
+        "properties": {
+            "file_path": {"type": "string"},
+            "format": {"enum": ["csv", "json", "excel", "parquet"]},
+        },
+    },
+}
+
+
+# fastjsonschema's "integer" accepts floats with no fractional part, such as
+# 2.0, and its "array" accepts tuples; these fields must have the exact
+# Python type the hand-written checks require, which the schemas cannot
+# express
+STRICT_TYPE_FIELDS: Dict[str, Tuple[Tuple[str, type], ...]] = {
+    "model_call": (("max_concurrency", int), ("batch_size", int)),
+    "aggregate": (("group_by", list),),
+}
+
+
+def _has_strict_types(task: Dict[str, Any]) -> bool:
+    """Check that a task's strict type fields, if present, have their type."""
+    for key, expected in STRICT_TYPE_FIELDS.get(task["task"], ()):
+        if key in task and not isinstance(task[key], expected):
+            return False
+    return True
+
+
+def _compile_task_schemas() -> Dict[str, Callable[[Any], Any]]:
+    """Compile the task schemas once per process, if fastjsonschema is installed."""
+    if fastjsonschema is None:
+        return {}
+    return {
+        task_type: fastjsonschema.compile(schema)
+        for task_type, schema in TASK_SCHEMAS.items()
+    }
+
+
+_COMPILED_TASK_SCHEMAS = _compile_task_schemas()
+
+
 class AIONValidator:
     """Validates AION program schemas."""
 
+    required_task_fields = frozenset({"task"})
+    valid_task_types = VALID_TASK_TYPES
+
     def __init__(self):
-        self.required_task_fields = {"task"}
-        self.valid_task_types = {
-            "filter",
-            "sort",
-            "transform",
-            "model_call",
-            "aggregate",
-            "export",
-        }
+        self._validators = _COMPILED_TASK_SCHEMAS
+        # Indexed by TaskType
+        self._task_validators = (
+            self._validate_filter_task,
+            self._validate_sort_task,
+            self._validate_transform_task,
+            self._validate_model_call_task,
+            self._validate_aggregate_task,
+            self._validate_export_task,
+        )
 
     def validate_program(self, program: Dict[str, Any]) -> List[ValidationError]:
         """Validate a complete AION program.
@@ -38,7 +210,22 @@ class AIONValidator:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
+        return self.compile_program(program)[0]
+
+    def compile_program(
+        self, program: Dict[str, Any]
+    ) -> Tuple[List[ValidationError], List[TypedTask]]:
+        """Validate a program and flatten its valid tasks in the same pass.
+
+        Args:
+            program: The AION program to validate
+
+        Returns:
+            Tuple of validation errors (empty if valid) and the TypedTask of
+            every task that passed validation
+        """
+        errors: List[ValidationError] = []
+        typed: List[TypedTask] = []
 
         # Check for required top-level fields
         if "pipeline" not in program:
@@ -47,7 +234,7 @@ class AIONValidator:
                     path="root", message="Program must contain a 'pipeline' field"
                 )
             )
-            return errors
+            return errors, typed
 
         # Validate pipeline
         pipeline = program["pipeline"]
@@ -57,19 +244,33 @@ class AIONValidator:
                     path="pipeline", message="Pipeline must be a list of tasks"
                 )
             )
-            return errors
+            return errors, typed
 
         # Validate each task
         for i, task in enumerate(pipeline):
             task_errors = self._validate_task(task, f"pipeline[{i}]")
-            errors.extend(task_errors)
+            if task_errors:
+                errors.extend(task_errors)
+            else:
+                typed.append(type_task(task))
 
-        return errors
+        return errors, typed
 
     def _validate_task(self, task: Dict[str, Any], path: str) -> List[ValidationError]:
         """Validate a single task."""
         errors = []
 
+        # Fast path: a task matching its compiled schema is valid
+        if isinstance(task, dict) and isinstance(task.get("task"), str):
+            check = self._validators.get(task["task"])
+            if check is not None:
+                try:
+                    check(task)
+                    if _has_strict_types(task):
+                        return errors
+                except fastjsonschema.JsonSchemaException:
+                    pass
+
         # Check required fields
         if not isinstance(task, dict):
             errors.append(
@@ -94,28 +295,19 @@ class AIONValidator:
             )
             return errors
 
-        if task_type not in self.valid_task_types:
+        tag = TASK_TAGS.get(task_type)
+        if tag is None:
             errors.append(
                 ValidationError(
                     path=f"{path}.task",
                     message=f"Unknown task type: {task_type}. "
-                    f"Valid types: {self.valid_task_types}",
+                    f"Valid types: {_VALID_TYPES_STR}",
                 )
             )
+            return errors
 
         # Validate task-specific fields
-        if task_type == "filter":
-            errors.extend(self._validate_filter_task(task, path))
-        elif task_type == "sort":
-            errors.extend(self._validate_sort_task(task, path))
-        elif task_type == "transform":
-            errors.extend(self._validate_transform_task(task, path))
-        elif task_type == "model_call":
-            errors.extend(self._validate_model_call_task(task, path))
-        elif task_type == "aggregate":
-            errors.extend(self._validate_aggregate_task(task, path))
-        elif task_type == "export":
-            errors.extend(self._validate_export_task(task, path))
+        errors.extend(self._task_validators[tag](task, path))
 
         return errors
 
@@ -153,6 +345,14 @@ class AIONValidator:
                     )
                 )
 
+        if "engine" in task and task["engine"] not in ["pandas", "numba"]:
+            errors.append(
+                ValidationError(
+                    path=f"{path}.engine",
+                    message="Engine must be 'pandas' or 'numba'",
+                )
+            )
+
         return errors
 
     def _validate_sort_task(
@@ -240,6 +440,21 @@ class AIONValidator:
                     )
                 )
 
+        for key, label in (
+            ("max_concurrency", "Max concurrency"),
+            ("batch_size", "Batch size"),
+        ):
+            if key not in task:
+                continue
+            value = task[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                errors.append(
+                    ValidationError(
+                        path=f"{path}.{key}",
+                        message=f"{label} must be a positive integer",
+                    )
+                )
+
         return errors
 
     def _validate_aggregate_task(
@@ -284,6 +499,14 @@ class AIONValidator:
                 )
             )
 
+        if "engine" in task and task["engine"] not in ["cython", "numba"]:
+            errors.append(
+                ValidationError(
+                    path=f"{path}.engine",
+                    message="Engine must be 'cython' or 'numba'",
+                )
+            )
+
         return errors
 
     def _validate_export_task(
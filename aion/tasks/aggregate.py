@@ -2,19 +2,169 @@
 Aggregate task implementation for AION.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 
+from ..core.registry import TaskFailure
 
-def aggregate_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
+# Aggregations pandas can run through its Numba groupby kernels
+NUMBA_AGGREGATIONS = frozenset({"sum", "mean", "min", "max", "var", "std"})
+
+_NUMBA_ENGINE_KWARGS = {"parallel": True, "nogil": True}
+
+# Aggregations computed directly from group codes with np.bincount
+BINCOUNT_AGGREGATIONS = frozenset({"sum", "mean", "count"})
+
+# Narrower dtypes keep their own dtype in groupby results
+_BINCOUNT_DTYPES = (np.dtype(np.int64), np.dtype(np.float64))
+
+# Integer sums go through float64 weights; beyond this they may lose precision
+_EXACT_FLOAT_SUM = 2**53
+
+# Above this many rows hashing the keys dominates and groupby is as fast;
+# categorical keys factorize from their codes and have no limit
+BINCOUNT_MAX_ROWS = 250_000
+
+
+def _aggregate_numba(
+    data: pd.DataFrame, group_by: List[str], aggregations: Dict[str, str]
+) -> pd.DataFrame:
+    """Aggregate with pandas' JIT-compiled Numba groupby kernels.
+
+    pandas caches the compiled kernel per aggregation and engine options,
+    so repeated calls do not recompile.
+    """
+    grouped = data.groupby(group_by, sort=False, observed=True)
+    columns = {
+        field: getattr(grouped[field], func)(
+            engine="numba", engine_kwargs=_NUMBA_ENGINE_KWARGS
+        )
+        for field, func in aggregations.items()
+    }
+    return pd.DataFrame(columns).reset_index()
+
+
+def _group_codes(
+    data: pd.DataFrame, group_by: List[str]
+) -> Optional[Tuple[np.ndarray, int]]:
+    """Factorize the group keys into dense codes in first-appearance order.
+
+    Rows with a missing key get code -1, matching groupby's dropna.
+
+    Returns:
+        Codes and number of groups, or None if the key combination space
+        is too large to combine into one int64 code
+    """
+    codes, uniques = pd.factorize(data[group_by[0]])
+    for key in group_by[1:]:
+        key_codes, key_uniques = pd.factorize(data[key])
+        n_key = max(len(key_uniques), 1)
+        if (len(uniques) + 1) * n_key >= 2**62:
+            return None
+        valid = (codes >= 0) & (key_codes >= 0)
+        combined = codes[valid] * n_key + key_codes[valid]
+        codes = np.full(len(codes), -1, dtype=np.intp)
+        codes[valid], uniques = pd.factorize(combined)
+    return codes, len(uniques)
+
+
+def _aggregate_bincount(
+    data: pd.DataFrame, group_by: List[str], aggregations: Dict[str, str]
+) -> Optional[pd.DataFrame]:
+    """Aggregate sum/mean/count of int64/float64 columns with np.bincount.
+
+    One factorize of the keys replaces groupby's setup, and every
+    aggregation is a single weighted bincount over the group codes, with
+    no sort. Output matches ``groupby(sort=False, observed=True,
+    as_index=False).agg``.
+
+    Returns:
+        Aggregated DataFrame, or None if the task needs the regular groupby
+    """
+    if len(data) > BINCOUNT_MAX_ROWS and not all(
+        isinstance(data[key].dtype, pd.CategoricalDtype) for key in group_by
+    ):
+        return None
+    for field, func in aggregations.items():
+        dtype = data[field].dtype
+        if (
+            not isinstance(func, str)
+            or func not in BINCOUNT_AGGREGATIONS
+            or field in group_by
+            or dtype not in _BINCOUNT_DTYPES
+        ):
+            return None
+
+    grouping = _group_codes(data, group_by)
+    if grouping is None:
+        return None
+    codes, n_groups = grouping
+    if n_groups == 0:
+        return None
+
+    valid = codes >= 0
+    has_missing_keys = not valid.all()
+    if has_missing_keys:
+        positions = np.flatnonzero(valid)
+        codes = codes[valid]
+    else:
+        positions = np.arange(len(codes))
+
+    # Each group's first row supplies its key values; writing positions in
+    # reverse leaves the earliest one per code
+    first = np.empty(n_groups, dtype=np.intp)
+    first[codes[::-1]] = positions[::-1]
+
+    columns: Dict[str, np.ndarray] = {}
+    for field, func in aggregations.items():
+        values = data[field].to_numpy()
+        if has_missing_keys:
+            values = values[valid]
+
+        if values.dtype.kind == "f":
+            present = ~np.isnan(values)
+            values = np.where(present, values, 0.0)
+            counts = np.bincount(codes, weights=present, minlength=n_groups)
+            counts = counts.astype(np.int64)
+        else:
+            # Bound in float64: an int64 sum of magnitudes can wrap around
+            if (
+                func == "sum"
+                and np.abs(values.astype(np.float64)).sum() >= _EXACT_FLOAT_SUM
+            ):
+                return None
+            counts = np.bincount(codes, minlength=n_groups)
+
+        if func == "count":
+            columns[field] = counts
+            continue
+
+        totals = np.bincount(codes, weights=values, minlength=n_groups)
+        if func == "sum":
+            if values.dtype.kind != "f":
+                totals = totals.astype(np.int64)
+            columns[field] = totals
+        else:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                columns[field] = totals / counts
+
+    keys = {key: data[key].array.take(first) for key in group_by}
+    return pd.DataFrame({**keys, **columns})
+
+
+def aggregate_task(
+    data: pd.DataFrame, task: Dict[str, Any]
+) -> Union[pd.DataFrame, TaskFailure]:
     """Aggregate data using groupby operations.
 
     Args:
         data: Input DataFrame
-        task: Task configuration with group_by and aggregations
+        task: Task configuration with group_by, aggregations and an optional
+            engine ('cython' or 'numba')
 
     Returns:
-        Aggregated DataFrame
+        Aggregated DataFrame, or TaskFailure if a field is missing
     """
     if data.empty:
         return data
@@ -28,20 +178,35 @@ def aggregate_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
     if not aggregations:
         raise ValueError("Aggregate task must specify 'aggregations'")
 
+    columns = set(data.columns)
+
     # Validate group_by fields exist
-    for field in group_by:
-        if field not in data.columns:
-            raise ValueError(f"Group by field '{field}' not found in data")
+    missing = set(group_by) - columns
+    if missing:
+        return TaskFailure(f"Group by fields not found in data: {sorted(missing)}")
 
     # Validate aggregation fields exist
-    for field in aggregations.keys():
-        if field not in data.columns:
-            raise ValueError(f"Aggregation field '{field}' not found in data")
+    missing = aggregations.keys() - columns
+    if missing:
+        return TaskFailure(f"Aggregation fields not found in data: {sorted(missing)}")
+
+    # Numba engine covers single numeric reductions; anything else (lists
+    # of functions, count, ...) goes through the regular groupby below
+    if task.get("engine") == "numba" and all(
+        isinstance(func, str) and func in NUMBA_AGGREGATIONS
+        for func in aggregations.values()
+    ):
+        return _aggregate_numba(data, group_by, aggregations)
+
+    result = _aggregate_bincount(data, group_by, aggregations)
+    if result is not None:
+        return result
 
-    # Perform aggregation
-    grouped = data.groupby(group_by)
+    # Perform aggregation; groups come out in order of first appearance
+    # and as regular columns, so no sort or reset_index copy is needed
+    grouped = data.groupby(group_by, sort=False, observed=True, as_index=False)
 
     # Apply aggregations
-    result = grouped.agg(aggregations).reset_index()
+    result = grouped.agg(aggregations)
 
     return result
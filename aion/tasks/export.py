@@ -6,6 +6,100 @@ from typing import Dict, Any
 import pandas as pd
 import os
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if orjson is not None
+    else 0
+)
+
+
+def _ensure_dir(file_path: str) -> None:
+    """Create the parent directory of ``file_path`` if it is missing."""
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+
+def write_csv(data: pd.DataFrame, file_path: str) -> None:
+    """Write a DataFrame to CSV without its index.
+
+    Frames made up only of integer columns go through Polars' native CSV
+    writer when it is installed, since it formats them exactly like
+    pandas. Everything else is written with pandas: Polars spells
+    booleans, datetimes, small floats and empty strings differently.
+    Line endings are LF on every platform.
+    """
+    if (
+        pl is not None
+        and not isinstance(data.columns, pd.MultiIndex)
+        and len(data.columns)
+        and all(pd.api.types.is_integer_dtype(dtype) for dtype in data.dtypes)
+    ):
+        try:
+            frame = pl.from_pandas(data)
+        except (TypeError, ValueError, pl.exceptions.PolarsError):
+            frame = None
+        if frame is not None:
+            frame.write_csv(file_path)
+            return
+
+    data.to_csv(file_path, index=False, lineterminator="\n")
+
+
+def write_parquet(data: pd.DataFrame, file_path: str) -> None:
+    """Write a DataFrame to Parquet without its index.
+
+    Goes straight to ``pyarrow.parquet`` with zstd compression and
+    dictionary encoding when PyArrow is installed, otherwise defers to
+    pandas' configured Parquet engine.
+    """
+    if pa is not None:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        pq.write_table(table, file_path, compression="zstd", use_dictionary=True)
+        return
+
+    data.to_parquet(file_path, index=False)
+
+
+def write_json(data: pd.DataFrame, file_path: str) -> None:
+    """Write a DataFrame to JSON as an indented list of records.
+
+    Serializes the records with orjson when installed. Datetime-like
+    columns, and values orjson cannot encode, keep pandas' JSON writer so
+    their encoding does not change.
+    """
+    if orjson is not None and not any(
+        pd.api.types.is_datetime64_any_dtype(dtype)
+        or pd.api.types.is_timedelta64_dtype(dtype)
+        for dtype in data.dtypes
+    ):
+        try:
+            payload = orjson.dumps(
+                data.to_dict(orient="records"), option=_ORJSON_OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            payload = None
+        if payload is not None:
+            with open(file_path, "wb") as f:
+                f.write(payload)
+            return
+
+    data.to_json(file_path, orient="records", indent=2)
+
 
 def export_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
     """Export data to various file formats.
@@ -27,17 +121,17 @@ def export_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
         raise ValueError("Export task must specify 'file_path'")
 
     # Ensure directory exists
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    _ensure_dir(file_path)
 
     # Export based on format
     if file_format.lower() == "csv":
-        data.to_csv(file_path, index=False)
+        write_csv(data, file_path)
     elif file_format.lower() == "json":
-        data.to_json(file_path, orient="records", indent=2)
+        write_json(data, file_path)
     elif file_format.lower() == "excel":
         data.to_excel(file_path, index=False)
     elif file_format.lower() == "parquet":
-        data.to_parquet(file_path, index=False)
+        write_parquet(data, file_path)
     else:
         raise ValueError(f"Unsupported export format: {file_format}")
 
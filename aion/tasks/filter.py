@@ -2,52 +2,153 @@
 Filter task implementation for AION.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
+import numpy as np
 import pandas as pd
 import operator
 
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
 
-def filter_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
+from ..core.registry import TaskFailure
+from ..core.jit_fuser import comparison_kernel
+
+# Map operator strings to functions
+_OP_MAP = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "in": lambda x, y: x.isin(y),
+    "not in": lambda x, y: ~x.isin(y),
+    "contains": lambda x, y: x.str.contains(y, na=False),
+    "startswith": lambda x, y: x.str.startswith(y, na=False),
+    "endswith": lambda x, y: x.str.endswith(y, na=False),
+}
+
+# NumPy ufuncs for comparisons of NumPy numeric columns against a number,
+# keyed by operator and dtype kind. They skip pandas' Series dispatch and
+# build the mask straight from the column buffer
+_FILTER_FASTPATH = {
+    (op_str, kind): ufunc
+    for op_str, ufunc in (
+        ("==", np.equal),
+        ("!=", np.not_equal),
+        (">", np.greater),
+        (">=", np.greater_equal),
+        ("<", np.less),
+        ("<=", np.less_equal),
+    )
+    for kind in "iufb"
+}
+
+
+def filter_task(
+    data: pd.DataFrame, task: Dict[str, Any]
+) -> Union[pd.DataFrame, TaskFailure]:
     """Filter data based on a condition.
 
+    The interpreter may fuse adjacent filters into one task whose condition
+    is ``{"op": "and", "conditions": [...]}``; their masks are ANDed and the
+    rows are selected once.
+
     Args:
         data: Input DataFrame
-        task: Task configuration with condition
+        task: Task configuration with condition and an optional engine
+            ('pandas' or 'numba')
 
     Returns:
-        Filtered DataFrame
+        Filtered DataFrame, or TaskFailure if the field is missing
     """
     if data.empty:
         return data
 
     condition = task["condition"]
+    engine = task.get("engine")
+    if condition.get("op") == "and":
+        conditions = condition["conditions"]
+    else:
+        conditions = (condition,)
+
+    masks = []
+    for sub_condition in conditions:
+        mask = _condition_mask(data, sub_condition, engine)
+        if isinstance(mask, TaskFailure):
+            return mask
+        masks.append(mask)
+
+    mask = masks[0] if len(masks) == 1 else np.logical_and.reduce(masks)
+    # Positional take skips boolean indexing's label alignment
+    return data.take(np.flatnonzero(mask))
+
+
+def _condition_mask(
+    data: pd.DataFrame, condition: Dict[str, Any], engine: Optional[str]
+) -> Union[np.ndarray, TaskFailure]:
+    """Evaluate one condition to a NumPy boolean mask.
+
+    Missing values in nullable masks count as not matching.
+    """
     field = condition["field"]
     op_str = condition["operator"]
     value = condition["value"]
 
-    # Map operator strings to functions
-    op_map = {
-        "==": operator.eq,
-        "!=": operator.ne,
-        ">": operator.gt,
-        ">=": operator.ge,
-        "<": operator.lt,
-        "<=": operator.le,
-        "in": lambda x, y: x.isin(y),
-        "not in": lambda x, y: ~x.isin(y),
-        "contains": lambda x, y: x.str.contains(y, na=False),
-        "startswith": lambda x, y: x.str.startswith(y, na=False),
-        "endswith": lambda x, y: x.str.endswith(y, na=False),
-    }
-
-    if op_str not in op_map:
+    op_func = _OP_MAP.get(op_str)
+    if op_func is None:
         raise ValueError(f"Unsupported operator: {op_str}")
 
-    op_func = op_map[op_str]
-
-    # Apply filter
     if field not in data.columns:
-        raise ValueError(f"Field '{field}' not found in data")
+        return TaskFailure(f"Field '{field}' not found in data")
+
+    column = data[field]
+    if engine == "numba":
+        mask = _numba_mask(column, op_str, value)
+        if mask is not None:
+            return mask
+
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and isinstance(value, (int, float)):
+        ufunc = _FILTER_FASTPATH.get((op_str, dtype.kind))
+        if ufunc is not None:
+            return ufunc(column.to_numpy(), value)
+
+    mask = op_func(column, value)
+    if mask.dtype == np.bool_:
+        return mask.to_numpy()
+    return mask.to_numpy(dtype=bool, na_value=False)
+
+
+def _numba_mask(column: pd.Series, op_str: str, value: Any) -> Any:
+    """Evaluate a numeric comparison with a compiled Numba kernel.
+
+    Returns:
+        Boolean mask array, or None if the column, operator or value is not
+        supported and the pandas comparison should be used
+    """
+    dtype = column.dtype
+    if (
+        not isinstance(dtype, np.dtype)
+        or dtype.kind not in "iuf"
+        or isinstance(value, bool)
+        or not isinstance(value, (int, float))
+    ):
+        return None
+
+    # Integers the column dtype cannot hold fail Numba's typing; pandas
+    # compares them exactly
+    if isinstance(value, int) and dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        if not info.min <= value <= info.max:
+            return None
 
-    mask = op_func(data[field], value)
-    return data[mask]
+    kernel = comparison_kernel(op_str)
+    if kernel is None:
+        return None
+    try:
+        return kernel(column.to_numpy(), value)
+    except numba.core.errors.TypingError:
+        return None
@@ -2,13 +2,45 @@
 Model call task implementation for AION.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import pandas as pd
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on in-flight API requests for a single model_call task
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Inputs sent per API request; 1 keeps one request per input
+DEFAULT_BATCH_SIZE = 1
+
+# Appended to the prompt when several inputs share one request
+BATCH_INSTRUCTIONS = (
+    "Apply the instructions above to each numbered input separately. "
+    'Respond only with a JSON object of the form {"outputs": [...]} holding '
+    "exactly one string per input, in the same order."
+)
+
+# Successful API responses, keyed by provider/model/prompt/input digest
+RESPONSE_CACHE_SIZE = 4096
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+
+def _cache_key(provider: str, model: str, prompt: str, input_text: str) -> bytes:
+    """Build a compact cache key for one model call."""
+    raw = "\x00".join((provider, model, prompt, input_text))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
+def clear_response_cache() -> None:
+    """Drop all cached model responses."""
+    _response_cache.clear()
+
 
 class ModelCallHandler:
     """Handles AI model calls with different providers."""
@@ -18,7 +50,12 @@ class ModelCallHandler:
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 
     def call_openai(
-        self, prompt: str, input_text: str, model: str = "gpt-3.5-turbo"
+        self,
+        prompt: str,
+        input_text: str,
+        model: str = "gpt-3.5-turbo",
+        max_tokens: int = 150,
+        json_output: bool = False,
     ) -> str:
         """Call OpenAI API."""
         if not self.openai_api_key:
@@ -29,14 +66,19 @@ class ModelCallHandler:
 
             client = openai.OpenAI(api_key=self.openai_api_key)
 
+            options = {}
+            if json_output:
+                options["response_format"] = {"type": "json_object"}
+
             response = client.chat.completions.create(
                 model=model,
                 messages=[
                     {"role": "system", "content": prompt},
                     {"role": "user", "content": input_text},
                 ],
-                max_tokens=150,
+                max_tokens=max_tokens,
                 temperature=0.1,
+                **options,
             )
             return response.choices[0].message.content.strip()
         except ImportError:
@@ -46,9 +88,18 @@ class ModelCallHandler:
             return f"[AI Error: {str(e)}]"
 
     def call_anthropic(
-        self, prompt: str, input_text: str, model: str = "claude-3-sonnet-20240229"
+        self,
+        prompt: str,
+        input_text: str,
+        model: str = "claude-3-sonnet-20240229",
+        max_tokens: int = 150,
+        json_output: bool = False,
     ) -> str:
-        """Call Anthropic API."""
+        """Call Anthropic API.
+
+        ``json_output`` is accepted for parity with ``call_openai``; the
+        Messages API has no JSON mode, so the prompt must ask for JSON.
+        """
         if not self.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
@@ -59,7 +110,7 @@ class ModelCallHandler:
 
             response = client.messages.create(
                 model=model,
-                max_tokens=150,
+                max_tokens=max_tokens,
                 messages=[
                     {"role": "user", "content": f"{prompt}\n\nInput: {input_text}"}
                 ],
@@ -77,6 +128,144 @@ class ModelCallHandler:
         """Simulate AI model call for testing."""
         return f"[AI: {prompt}] {input_text}"
 
+    def simulate_batch(self, prompt: str, inputs: pd.Series) -> pd.Series:
+        """Simulate AI model calls for a whole column at once.
+
+        Produces the same text as ``simulate_call`` for every element, as a
+        single vectorized string concatenation. Enum-like columns are
+        formatted once per distinct value and expanded by their codes.
+        Object columns always take the full path: factorize treats ``1``,
+        ``True`` and ``1.0`` as one value, but they format differently.
+        """
+        prefix = f"[AI: {prompt}] "
+        if isinstance(inputs.dtype, pd.CategoricalDtype):
+            codes, uniques = inputs.cat.codes.to_numpy(), inputs.cat.categories
+            # map(str) would keep the categorical dtype, which cannot be added
+            inputs = inputs.astype(object)
+        elif inputs.dtype != object and (
+            pd.api.types.is_string_dtype(inputs.dtype)
+            or pd.api.types.is_numeric_dtype(inputs.dtype)
+        ):
+            codes, uniques = pd.factorize(inputs)
+        else:
+            return prefix + inputs.map(str)
+
+        # Missing values are left out of the uniques; they keep the full path
+        # so None and NaN still format differently
+        if len(uniques) < 0.5 * len(inputs) and not (codes < 0).any():
+            texts = prefix + pd.Series(uniques).map(str)
+            return pd.Series(
+                texts.to_numpy().take(codes), index=inputs.index, dtype=texts.dtype
+            )
+
+        return prefix + inputs.map(str)
+
+    def call_batch(
+        self,
+        provider: str,
+        prompt: str,
+        inputs: List[str],
+        model: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[str]:
+        """Call an API provider for many inputs concurrently.
+
+        Requests are dispatched from a thread pool (the SDK clients block on
+        network IO, which releases the GIL). With ``batch_size > 1`` each
+        request carries a numbered list of inputs and asks for a JSON list
+        of outputs; a response that cannot be parsed is retried one input
+        per request. Outputs keep the order of ``inputs``; a failed request
+        yields an ``[Error: ...]`` string for that input only. Successful
+        responses are cached, so repeated inputs across calls are not sent
+        again.
+        """
+        call = self.call_openai if provider == "openai" else self.call_anthropic
+        keys = [_cache_key(provider, model, prompt, text) for text in inputs]
+        outputs: List[Optional[str]] = [_response_cache.get(key) for key in keys]
+        pending = [i for i, output in enumerate(outputs) if output is None]
+
+        def call_one(i: int) -> Tuple[str, bool]:
+            try:
+                output = call(prompt, inputs[i], model)
+            except Exception as e:
+                logger.error(f"Model call failed for input {i}: {e}")
+                return f"[Error: {str(e)}]", False
+            # Provider errors come back as "[AI Error: ...]" text
+            return output, not output.startswith("[AI Error:")
+
+        def call_group(group: List[int]) -> List[Tuple[str, bool]]:
+            if len(group) == 1:
+                return [call_one(group[0])]
+
+            numbered = "\n".join(
+                f"{n}. {inputs[i]}" for n, i in enumerate(group, start=1)
+            )
+            try:
+                response = call(
+                    f"{prompt}\n\n{BATCH_INSTRUCTIONS}",
+                    numbered,
+                    model,
+                    max_tokens=150 * len(group),
+                    json_output=True,
+                )
+                parsed = _parse_batch_response(response, len(group))
+            except Exception as e:
+                logger.warning(f"Batched model call failed: {e}")
+                parsed = None
+
+            if parsed is None:
+                return [call_one(i) for i in group]
+            return [(output, True) for output in parsed]
+
+        for i, output in enumerate(outputs):
+            if output is not None:
+                _response_cache.move_to_end(keys[i])
+
+        if pending:
+            groups = [
+                pending[start : start + batch_size]
+                for start in range(0, len(pending), batch_size)
+            ]
+            workers = max(1, min(max_concurrency, len(groups)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = [
+                    response
+                    for group_responses in executor.map(call_group, groups)
+                    for response in group_responses
+                ]
+
+            for i, (output, cacheable) in zip(pending, responses):
+                outputs[i] = output
+                if cacheable:
+                    _response_cache[keys[i]] = output
+            while len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+
+        return outputs
+
+
+def _parse_batch_response(response: str, expected: int) -> Optional[List[str]]:
+    """Extract the outputs list from a batched model response.
+
+    Returns:
+        One output string per input, or None if the response is not a JSON
+        object with an ``outputs`` list of the expected length
+    """
+    start, end = response.find("{"), response.rfind("}")
+    if start < 0 or end < start:
+        return None
+
+    try:
+        payload = json.loads(response[start : end + 1])
+    except ValueError:
+        return None
+
+    outputs = payload.get("outputs") if isinstance(payload, dict) else None
+    if not isinstance(outputs, list) or len(outputs) != expected:
+        return None
+    return [str(output).strip() for output in outputs]
+
 
 def model_call_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
     """Call an AI model to process data.
@@ -97,30 +286,30 @@ def model_call_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
     provider = task.get("provider", "simulate")  # openai, anthropic, simulate
     model = task.get("model", "gpt-3.5-turbo")
 
-    result = data.copy()
+    # Columns are only ever replaced, never written in place, so the
+    # input's arrays can be shared
+    result = data.copy(deep=False)
     handler = ModelCallHandler()
 
-    # Process each row
-    if input_field and input_field in data.columns:
-        outputs = []
-        for idx, row in data.iterrows():
-            input_text = str(row[input_field])
-
-            try:
-                if provider == "openai":
-                    output = handler.call_openai(prompt, input_text, model)
-                elif provider == "anthropic":
-                    output = handler.call_anthropic(prompt, input_text, model)
-                else:
-                    output = handler.simulate_call(prompt, input_text)
-
-                outputs.append(output)
-
-            except Exception as e:
-                logger.error(f"Model call failed for row {idx}: {e}")
-                outputs.append(f"[Error: {str(e)}]")
+    has_input = bool(input_field) and input_field in data.columns
 
-        result[output_field] = outputs
+    if has_input and provider not in ("openai", "anthropic"):
+        # Simulated calls need no per-row work
+        result[output_field] = handler.simulate_batch(prompt, data[input_field])
+    elif has_input:
+        # API calls are IO bound, so dispatch them concurrently and only
+        # once per distinct input
+        inputs = data[input_field].map(str)
+        unique_inputs = pd.unique(inputs).tolist()
+        outputs = handler.call_batch(
+            provider,
+            prompt,
+            unique_inputs,
+            model,
+            task.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+            task.get("batch_size", DEFAULT_BATCH_SIZE),
+        )
+        result[output_field] = inputs.map(dict(zip(unique_inputs, outputs)))
     else:
         # No input field specified, just add the prompt as context
         result[output_field] = f"[AI: {prompt}]"
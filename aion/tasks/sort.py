@@ -2,11 +2,16 @@
 Sort task implementation for AION.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Union
+import numpy as np
 import pandas as pd
 
+from ..core.registry import TaskFailure
 
-def sort_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
+
+def sort_task(
+    data: pd.DataFrame, task: Dict[str, Any]
+) -> Union[pd.DataFrame, TaskFailure]:
     """Sort data by specified fields.
 
     Args:
@@ -14,7 +19,7 @@ def sort_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
         task: Task configuration with operation
 
     Returns:
-        Sorted DataFrame
+        Sorted DataFrame, or TaskFailure if the field is missing
     """
     if data.empty:
         return data
@@ -25,10 +30,44 @@ def sort_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
 
     # Validate field exists
     if field not in data.columns:
-        raise ValueError(f"Field '{field}' not found in data")
+        return TaskFailure(f"Field '{field}' not found in data")
 
     # Determine sort order
     ascending = order.lower() == "asc"
 
+    # Already-ordered input (e.g. a re-run on sorted data) needs no sort;
+    # the monotonic checks are a single O(n) scan and fail on any NaN
+    column = data[field]
+    if ascending and column.is_monotonic_increasing:
+        return data
+    if not ascending and column.is_monotonic_decreasing:
+        return data
+
+    # Plain numeric columns sort with one argsort and a positional take
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "iufb":
+        return data.take(_argsort(column.to_numpy(), ascending))
+
     # Sort the data
     return data.sort_values(by=field, ascending=ascending)
+
+
+def _argsort(values: np.ndarray, ascending: bool) -> np.ndarray:
+    """Sort positions for a numeric array, with NaNs last like pandas.
+
+    Follows pandas' ``nargsort``: a descending sort reverses the input,
+    sorts it stably and reverses the result, so tied rows keep their
+    input order either way.
+    """
+    positions = np.arange(len(values))
+    if values.dtype.kind == "f":
+        missing = np.isnan(values)
+        nan_positions = positions[missing]
+        values, positions = values[~missing], positions[~missing]
+    else:
+        nan_positions = positions[:0]
+
+    if ascending:
+        order = positions[np.argsort(values, kind="stable")]
+    else:
+        order = positions[::-1][np.argsort(values[::-1], kind="stable")][::-1]
+    return np.concatenate([order, nan_positions])
@@ -2,11 +2,64 @@
 Transform task implementation for AION.
 """
 
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Set, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, reduce
+import operator
+import os
+import numpy as np
 import pandas as pd
 
+try:
+    import numexpr
+except ImportError:  # pragma: no cover - optional dependency
+    numexpr = None
 
-def transform_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
+from ..core.registry import TaskFailure
+
+# Arithmetic expression keys, with their numexpr operator and function
+EXPRESSION_OPERATORS = {
+    "add": ("+", operator.add),
+    "sub": ("-", operator.sub),
+    "mul": ("*", operator.mul),
+    "div": ("/", operator.truediv),
+}
+
+# Below this many rows numexpr's setup costs more than NumPy's temporaries
+NUMEXPR_MIN_ROWS = 100_000
+
+# Column dtypes numexpr computes natively; others (int8, uint64, ...) are
+# cast by numexpr and would give different dtypes or values than NumPy
+_NUMEXPR_DTYPES = frozenset(
+    np.dtype(t) for t in (np.int32, np.int64, np.float32, np.float64)
+)
+
+# Below this many rows computed fields are cheaper to build one by one
+# than to hand to worker threads
+PARALLEL_MIN_ROWS = 100_000
+
+
+def _is_literal(field: str) -> bool:
+    """Check whether a concat part that is not a column is a string literal.
+
+    Short strings, whitespace and common punctuation are allowed as
+    literals; anything else is reported as a missing field.
+    """
+    return (
+        field.strip() == ""
+        or len(field) <= 3
+        or field.startswith(" ")
+        or field.endswith(" ")
+        or "(" in field
+        or ")" in field
+        or "-" in field
+        or ":" in field
+    )
+
+
+def transform_task(
+    data: pd.DataFrame, task: Dict[str, Any]
+) -> Union[pd.DataFrame, TaskFailure]:
     """Transform data fields based on mapping.
 
     Args:
@@ -14,24 +67,28 @@ def transform_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
         task: Task configuration with mapping
 
     Returns:
-        Transformed DataFrame
+        Transformed DataFrame, or TaskFailure if a source field is missing
     """
     if data.empty:
         return data
 
     mapping = task["mapping"]
-    result = data.copy()
+    new_columns: Dict[Any, Any] = {}
+    # Concat and expression fields are validated here and computed after
+    # the loop; each one only reads input columns, so they can run in
+    # parallel
+    jobs: Dict[Any, Callable[[], Any]] = {}
     fields_to_remove = set()
 
     for new_field, source in mapping.items():
         if isinstance(source, str):
             # Simple field rename
             if source in data.columns:
-                result[new_field] = data[source]
+                new_columns[new_field] = data[source]
                 # Mark original field for removal
                 fields_to_remove.add(source)
             else:
-                raise ValueError(f"Source field '{source}' not found in data")
+                return TaskFailure(f"Source field '{source}' not found in data")
 
         elif isinstance(source, dict):
             # Complex transformation
@@ -41,48 +98,202 @@ def transform_task(data: pd.DataFrame, task: Dict[str, Any]) -> pd.DataFrame:
                 if not isinstance(fields_to_concat, list):
                     raise ValueError("concat must be a list of fields")
 
-                # Validate only actual column names exist
+                # Classify each part once as a column or literal text,
+                # merging adjacent literals, before stringifying columns
+                parts = []
                 for field in fields_to_concat:
-                    if isinstance(field, str) and field not in data.columns:
-                        # Check if it's a string literal that should be allowed
-                        is_literal = (
-                            field.strip() == ""
-                            or len(field) <= 3
-                            or field.startswith(" ")
-                            or field.endswith(" ")
-                            or "(" in field
-                            or ")" in field
-                            or "-" in field
-                            or ":" in field
-                        )
-                        if is_literal:
-                            # Allow short strings, whitespace, and common punctuation
-                            continue
-                        else:
-                            raise ValueError(f"Field '{field}' not found in data")
-
-                # Concatenate
-                result[new_field] = ""
-                for field in fields_to_concat:
-                    if isinstance(field, str):
-                        if field in data.columns:
-                            result[new_field] += data[field].astype(str)
-                        else:
-                            # Treat as literal string
-                            result[new_field] += field
+                    if isinstance(field, str) and field in data.columns:
+                        parts.append(data[field])
+                        continue
+                    if isinstance(field, str) and not _is_literal(field):
+                        return TaskFailure(f"Field '{field}' not found in data")
+                    if parts and isinstance(parts[-1], str):
+                        parts[-1] += str(field)
                     else:
-                        result[new_field] += str(field)
+                        parts.append(str(field))
+
+                new_columns[new_field] = None
+                jobs[new_field] = partial(_concat, parts)
+
+            elif len(source) == 1 and next(iter(source)) in EXPRESSION_OPERATORS:
+                columns: List[Any] = []
+                expression = _lower_expression(data, source, columns)
+                if isinstance(expression, TaskFailure):
+                    return expression
+                new_columns[new_field] = None
+                jobs[new_field] = partial(
+                    _eval_expression, data, source, expression, columns
+                )
 
             else:
                 raise ValueError(f"Unknown transformation: {source}")
 
         else:
             # Constant value
-            result[new_field] = source
+            new_columns[new_field] = source
+
+    # Computed values replace their placeholders, keeping mapping order
+    new_columns.update(_run_jobs(jobs, len(data)))
+    return _apply_columns(data, new_columns, fields_to_remove)
+
+
+def _concat(parts: List[Any]) -> Any:
+    """Concatenate columns and literal text in one chain of vectorized adds."""
+    parts = [part if isinstance(part, str) else part.astype(str) for part in parts]
+    return reduce(operator.add, parts) if parts else ""
+
+
+def _run_jobs(jobs: Dict[Any, Callable[[], Any]], n_rows: int) -> Dict[Any, Any]:
+    """Compute fields, on worker threads when there are several large ones.
+
+    NumPy, numexpr and Arrow string kernels release the GIL, so fields
+    computed on separate threads run concurrently.
+    """
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers < 2 or n_rows < PARALLEL_MIN_ROWS:
+        return {field: job() for field, job in jobs.items()}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {field: executor.submit(job) for field, job in jobs.items()}
+        return {field: future.result() for field, future in futures.items()}
+
+
+def _eval_expression(
+    data: pd.DataFrame, spec: Dict[str, Any], expression: str, columns: List[Any]
+) -> Any:
+    """Evaluate an arithmetic expression tree over columns and numbers.
+
+    ``{"mul": [{"add": ["a", "b"]}, 2]}`` computes ``(a + b) * 2``. On
+    large numeric frames the tree's lowered numexpr string is evaluated in
+    a single blocked pass without a temporary array per operator;
+    otherwise the operators are applied directly to the column arrays (or
+    Series, for non-numeric columns).
+
+    Args:
+        data: Input DataFrame
+        spec: Expression tree
+        expression: ``spec`` lowered by ``_lower_expression``
+        columns: Columns referenced by ``expression``, in slot order
+    """
+    if not columns:
+        return _evaluate(spec, {})
+    if not all(
+        isinstance(data[column].dtype, np.dtype) and data[column].dtype.kind in "iuf"
+        for column in columns
+    ):
+        return _evaluate(spec, {column: data[column] for column in columns})
+
+    arrays = {column: data[column].to_numpy() for column in columns}
+    values = None
+    if numexpr is not None and len(data) >= NUMEXPR_MIN_ROWS:
+        values = _numexpr_evaluate(spec, expression, arrays, columns)
+    if values is None:
+        values = _evaluate(spec, arrays)
+    return pd.Series(values, index=data.index)
+
+
+def _numexpr_evaluate(
+    spec: Dict[str, Any], expression: str, arrays: Dict[Any, Any], columns: List[Any]
+) -> Optional[np.ndarray]:
+    """Evaluate a lowered expression with numexpr, if it matches NumPy.
+
+    Returns:
+        The values, or None if a column dtype or the result dtype differs
+        from what applying the operators with NumPy gives
+    """
+    if any(array.dtype not in _NUMEXPR_DTYPES for array in arrays.values()):
+        return None
+
+    # NumPy's result dtype, from the same tree over empty columns; literals
+    # that do not fit a column's dtype raise here as they would below
+    try:
+        expected = _evaluate(spec, {c: a[:0] for c, a in arrays.items()}).dtype
+    except (OverflowError, TypeError):
+        return None
+
+    local_dict = {f"c{i}": arrays[column] for i, column in enumerate(columns)}
+    values = numexpr.evaluate(expression, local_dict=local_dict)
+    return values if values.dtype == expected else None
+
+
+def _lower_expression(
+    data: pd.DataFrame, spec: Any, columns: List[Any]
+) -> Union[str, TaskFailure]:
+    """Validate an expression tree and lower it to a numexpr string.
+
+    Columns are appended to ``columns`` and referenced as ``c0``, ``c1``, ...
+    """
+    if isinstance(spec, dict):
+        if len(spec) != 1:
+            raise ValueError(f"Expression must have exactly one operator: {spec}")
+        name, operands = next(iter(spec.items()))
+        if name not in EXPRESSION_OPERATORS:
+            raise ValueError(f"Unknown expression operator: {name}")
+        if not isinstance(operands, list) or len(operands) < 2:
+            raise ValueError(f"'{name}' must be a list of at least two operands")
+
+        lowered = []
+        for operand in operands:
+            part = _lower_expression(data, operand, columns)
+            if isinstance(part, TaskFailure):
+                return part
+            lowered.append(part)
+        return "(" + f" {EXPRESSION_OPERATORS[name][0]} ".join(lowered) + ")"
+
+    if isinstance(spec, str):
+        if spec not in data.columns:
+            return TaskFailure(f"Field '{spec}' not found in data")
+        if spec not in columns:
+            columns.append(spec)
+        return f"c{columns.index(spec)}"
+
+    if isinstance(spec, (int, float)) and not isinstance(spec, bool):
+        return repr(spec)
+
+    raise ValueError(f"Unsupported expression operand: {spec!r}")
+
+
+def _evaluate(spec: Any, values: Dict[Any, Any]) -> Any:
+    """Apply a validated expression tree to resolved column values."""
+    if isinstance(spec, dict):
+        name, operands = next(iter(spec.items()))
+        func = EXPRESSION_OPERATORS[name][1]
+        return reduce(func, [_evaluate(operand, values) for operand in operands])
+    if isinstance(spec, str):
+        return values[spec]
+    return spec
+
+
+def _apply_columns(
+    data: pd.DataFrame, new_columns: Dict[Any, Any], fields_to_remove: Set[Any]
+) -> pd.DataFrame:
+    """Build the transform output with a single drop and a single concat.
+
+    Equivalent to assigning every new column in mapping order and then
+    dropping the renamed sources: existing columns are replaced in place,
+    new ones are appended, and any name in ``fields_to_remove`` is dropped
+    even if the mapping also produced it.
+    """
+    to_drop = [field for field in fields_to_remove if field in data.columns]
+    # Columns are only ever replaced, never written in place, so the
+    # input's arrays can be shared
+    result = data.drop(columns=to_drop) if to_drop else data.copy(deep=False)
 
-    # Remove original fields that were renamed
-    for field in fields_to_remove:
-        if field in result.columns:
-            result = result.drop(columns=[field])
+    appended = []
+    for name, value in new_columns.items():
+        if name in fields_to_remove:
+            continue
+        if name in data.columns:
+            result[name] = value
+            continue
+        if value is None:
+            # pd.Series(None) would fill with NaN rather than None
+            value = pd.Series([None] * len(data), index=data.index, dtype=object)
+        elif not isinstance(value, pd.Series):
+            value = pd.Series(value, index=data.index)
+        appended.append(value.rename(name))
 
+    if appended:
+        result = pd.concat([result, *appended], axis=1)
+        result.columns.name = data.columns.name
     return result
@@ -28,7 +28,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "pandas>=1.3.0",
+        "pandas>=2.0.0",
         "openai>=1.0.0",
         "anthropic>=0.7.0",
     ],
@@ -42,6 +42,19 @@ setup(
             "openpyxl>=3.0.0",
             "pyarrow>=10.0.0",
         ],
+        "polars": [
+            "polars>=1.25.0",
+            "pyarrow>=10.0.0",
+        ],
+        "numba": [
+            "numba>=0.57.0",
+        ],
+        "validation": [
+            "fastjsonschema>=2.16.0",
+        ],
+        "json": [
+            "orjson>=3.6.0",
+        ],
     },
     entry_points={
         "console_scripts": [
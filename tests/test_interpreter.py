@@ -5,7 +5,9 @@ Tests for AION interpreter.
 import pytest
 import pandas as pd
 import tempfile
+import json
 import os
+from aion.cli import load_data, load_program
 from aion.core.interpreter import AIONInterpreter
 
 
@@ -86,6 +88,63 @@ class TestFilterTask:
         assert result.errors
         assert "not found in data" in result.errors[0]
 
+    def test_numeric_comparisons_with_missing_values(self, interpreter):
+        """Test numeric comparisons treat NaN like pandas does."""
+        data = pd.DataFrame({"x": [1.0, float("nan"), 3.0, 2.0]})
+
+        for op_str, expected in (
+            ("<", [1.0]),
+            (">=", [3.0, 2.0]),
+            ("!=", [1.0, float("nan"), 3.0]),
+        ):
+            program = {
+                "pipeline": [
+                    {
+                        "task": "filter",
+                        "condition": {"field": "x", "operator": op_str, "value": 2},
+                    }
+                ]
+            }
+
+            result = interpreter.execute(program, data)
+
+            assert not result.errors
+            assert result.data["x"].tolist() == pytest.approx(expected, nan_ok=True)
+
+    def test_numba_engine(self, interpreter, sample_data):
+        """Test that the numba filter engine matches the pandas comparison."""
+        pytest.importorskip("numba")
+        for condition in (
+            {"field": "age", "operator": ">=", "value": 35},
+            {"field": "score", "operator": "!=", "value": 92.0},
+            {"field": "status", "operator": "==", "value": "active"},
+        ):
+            task = {"task": "filter", "condition": condition}
+
+            expected = interpreter.execute({"pipeline": [task]}, sample_data)
+            result = interpreter.execute(
+                {"pipeline": [dict(task, engine="numba")]}, sample_data
+            )
+
+            assert not result.errors
+            pd.testing.assert_frame_equal(result.data, expected.data)
+
+    def test_numba_engine_out_of_range_value(self, interpreter):
+        """Test that integers outside the column dtype fall back to pandas."""
+        pytest.importorskip("numba")
+        data = pd.DataFrame({"x": list(range(100))})
+        task = {
+            "task": "filter",
+            "condition": {"field": "x", "operator": "<", "value": 2**64},
+        }
+
+        expected = interpreter.execute({"pipeline": [task]}, data)
+        result = interpreter.execute({"pipeline": [dict(task, engine="numba")]}, data)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected.data)
+        assert len(result.data) == 100
+
 
 class TestSortTask:
     """Test sort task functionality."""
@@ -118,6 +177,40 @@ class TestSortTask:
         assert result.data["score"].iloc[0] == 95
         assert result.data["score"].iloc[-1] == 78
 
+    def test_sort_already_sorted(self, interpreter, sample_data):
+        """Test that sorted input is returned in its original order."""
+        program = {
+            "pipeline": [
+                {"task": "sort", "operation": {"field": "age", "order": "asc"}}
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, sample_data)
+
+    def test_sort_ties_keep_input_order(self, interpreter):
+        """Test that tied keys keep their input order in both directions."""
+        data = pd.DataFrame(
+            {"name": list("abcdef"), "score": [5, 1, 3, 7, 5, float("nan")]}
+        )
+
+        for order, expected in (
+            ("desc", ["d", "a", "e", "c", "b", "f"]),
+            ("asc", ["b", "c", "a", "e", "d", "f"]),
+        ):
+            program = {
+                "pipeline": [
+                    {"task": "sort", "operation": {"field": "score", "order": order}}
+                ]
+            }
+
+            result = interpreter.execute(program, data)
+
+            assert not result.errors
+            assert result.data["name"].tolist() == expected
+
 
 class TestTransformTask:
     """Test transform task functionality."""
@@ -157,6 +250,86 @@ class TestTransformTask:
         assert "description" in result.data.columns
         assert result.data["description"].iloc[0] == "Alice (25 years old)"
 
+    def test_arithmetic_expression(self, interpreter, sample_data):
+        """Test nested arithmetic expressions over columns and numbers."""
+        program = {
+            "pipeline": [
+                {
+                    "task": "transform",
+                    "mapping": {
+                        "weighted": {"mul": [{"add": ["score", "age"]}, 2]},
+                        "ratio": {"div": ["score", "age"]},
+                    },
+                }
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        assert result.data["weighted"].tolist() == [220, 244, 226, 270, 266]
+        assert result.data["ratio"].iloc[0] == pytest.approx(85 / 25)
+
+    def test_expression_dtypes_match_across_threshold(self, interpreter, monkeypatch):
+        """Test that numexpr gives the same values and dtypes as NumPy."""
+        pytest.importorskip("numexpr")
+        from aion.tasks import transform
+
+        data = pd.DataFrame(
+            {
+                "big": pd.Series([2**63 + 10] * 3, dtype="uint64"),
+                "small": pd.Series([1, 2, 3], dtype="int8"),
+                "single": pd.Series([0.5, 1.5, 2.5], dtype="float32"),
+                "wide": pd.Series([1, 2, 3], dtype="int64"),
+            }
+        )
+        program = {
+            "pipeline": [
+                {
+                    "task": "transform",
+                    "mapping": {
+                        "big_plus": {"add": ["big", 1]},
+                        "small_sq": {"mul": ["small", "small"]},
+                        "single_plus": {"add": ["single", 1.5]},
+                        "wide_div": {"div": [{"add": ["wide", 1]}, 2]},
+                    },
+                }
+            ]
+        }
+
+        expected = interpreter.execute(program, data)
+        monkeypatch.setattr(transform, "NUMEXPR_MIN_ROWS", 0)
+        result = interpreter.execute(program, data)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected.data)
+        assert result.data["big_plus"].iloc[0] == 2**63 + 11
+
+    def test_parallel_fields(self, interpreter, sample_data, monkeypatch):
+        """Test that fields computed on worker threads match serial ones."""
+        from aion.tasks import transform
+
+        program = {
+            "pipeline": [
+                {
+                    "task": "transform",
+                    "mapping": {
+                        "user_id": "id",
+                        "label": {"concat": ["name", " - ", "status"]},
+                        "total": {"add": ["score", "age"]},
+                    },
+                }
+            ]
+        }
+        expected = interpreter.execute(program, sample_data)
+
+        monkeypatch.setattr(transform, "PARALLEL_MIN_ROWS", 0)
+        monkeypatch.setattr(transform.os, "cpu_count", lambda: 4)
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected.data)
+
 
 class TestAggregateTask:
     """Test aggregate task functionality."""
@@ -180,6 +353,106 @@ class TestAggregateTask:
         assert "score" in result.data.columns
         assert "age" in result.data.columns
 
+    def test_numba_engine(self, interpreter, sample_data):
+        """Test that the numba engine matches the default groupby."""
+        pytest.importorskip("numba")
+        task = {
+            "task": "aggregate",
+            "group_by": ["status"],
+            "aggregations": {"score": "sum", "age": "mean"},
+        }
+
+        expected = interpreter.execute({"pipeline": [task]}, sample_data)
+        result = interpreter.execute(
+            {"pipeline": [dict(task, engine="numba")]}, sample_data
+        )
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected.data, check_dtype=False)
+
+    def test_bincount_matches_groupby(self, interpreter):
+        """Test that the bincount path matches groupby with missing values."""
+        data = pd.DataFrame(
+            {
+                "region": ["a", "b", None, "a", "b", "a"],
+                "tier": [1, 2, 1, 1, 2, 2],
+                "score": [1.5, float("nan"), 2.0, 3.0, 4.0, 5.0],
+                "visits": [1, 2, 3, 4, 5, 6],
+            }
+        )
+        aggregations = {"score": "mean", "visits": "sum"}
+        program = {
+            "pipeline": [
+                {
+                    "task": "aggregate",
+                    "group_by": ["region", "tier"],
+                    "aggregations": aggregations,
+                }
+            ]
+        }
+
+        result = interpreter.execute(program, data)
+        expected = data.groupby(
+            ["region", "tier"], sort=False, observed=True, as_index=False
+        ).agg(aggregations)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected)
+
+    def test_large_integer_sum_exact(self, interpreter):
+        """Test that integer sums beyond float64 precision stay exact."""
+        data = pd.DataFrame({"k": ["a", "a", "b"], "v": [2**62, 1, 2**62 + 1]})
+        program = {
+            "pipeline": [
+                {"task": "aggregate", "group_by": ["k"], "aggregations": {"v": "sum"}}
+            ]
+        }
+
+        result = interpreter.execute(program, data)
+
+        assert not result.errors
+        assert result.data["v"].tolist() == [2**62 + 1, 2**62 + 1]
+
+    def test_categorical_keys(self, interpreter, sample_data):
+        """Test that categorical keys keep their dtype and observed groups."""
+        data = sample_data.astype({"status": "category"})
+        data["status"] = data["status"].cat.add_categories(["unused"])
+        aggregations = {"score": "sum", "age": "mean"}
+        program = {
+            "pipeline": [
+                {
+                    "task": "aggregate",
+                    "group_by": ["status"],
+                    "aggregations": aggregations,
+                }
+            ]
+        }
+
+        result = interpreter.execute(program, data)
+        expected = data.groupby(
+            ["status"], sort=False, observed=True, as_index=False
+        ).agg(aggregations)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected)
+
+    def test_missing_fields(self, interpreter, sample_data):
+        """Test that all missing group-by fields are reported."""
+        program = {
+            "pipeline": [
+                {
+                    "task": "aggregate",
+                    "group_by": ["team", "status", "region"],
+                    "aggregations": {"score": "sum"},
+                }
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert result.errors
+        assert "not found in data: ['region', 'team']" in result.errors[0]
+
 
 class TestExportTask:
     """Test export task functionality."""
@@ -207,6 +480,96 @@ class TestExportTask:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    def test_write_csv(self, sample_data, tmp_path):
+        """Test that the CSV writer round-trips data without the index."""
+        from aion.tasks.export import write_csv
+
+        path = tmp_path / "out.csv"
+        write_csv(sample_data.iloc[::-1], str(path))
+
+        exported = pd.read_csv(path)
+        assert list(exported.columns) == list(sample_data.columns)
+        assert exported["name"].tolist() == sample_data["name"].tolist()[::-1]
+
+    def test_write_csv_formatting(self, tmp_path):
+        """Test that the CSV writer formats values exactly like pandas."""
+        from aion.tasks.export import write_csv
+
+        data = pd.DataFrame(
+            {
+                "flag": [True, False],
+                "when": pd.to_datetime(["2024-01-01 00:00", "2024-01-02 12:30"]),
+                "tiny": [1e-07, 0.5],
+                "text": ["", "a,b"],
+            }
+        )
+        path = tmp_path / "out.csv"
+        write_csv(data, str(path))
+
+        assert path.read_text() == (
+            "flag,when,tiny,text\n"
+            "True,2024-01-01 00:00:00,1e-07,\n"
+            'False,2024-01-02 12:30:00,0.5,"a,b"\n'
+        )
+
+    def test_export_bare_filename(
+        self, interpreter, sample_data, tmp_path, monkeypatch
+    ):
+        """Test exporting to a file in the working directory."""
+        monkeypatch.chdir(tmp_path)
+        program = {"pipeline": [{"task": "export", "file_path": "out.csv"}]}
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        assert len(pd.read_csv(tmp_path / "out.csv")) == len(sample_data)
+
+    def test_export_recreates_removed_directory(
+        self, interpreter, sample_data, tmp_path, monkeypatch
+    ):
+        """Test repeated exports survive a chdir and a deleted directory."""
+        program = {"pipeline": [{"task": "export", "file_path": "out/data.csv"}]}
+
+        for workdir in (tmp_path / "a", tmp_path / "b"):
+            workdir.mkdir()
+            monkeypatch.chdir(workdir)
+            assert not interpreter.execute(program, sample_data).errors
+            os.remove(workdir / "out" / "data.csv")
+            os.rmdir(workdir / "out")
+            assert not interpreter.execute(program, sample_data).errors
+            assert (workdir / "out" / "data.csv").exists()
+
+    def test_export_json(self, interpreter, sample_data, tmp_path):
+        """Test JSON export writes one record per row."""
+        path = tmp_path / "out.json"
+        program = {
+            "pipeline": [{"task": "export", "file_path": str(path), "format": "json"}]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        with open(path) as f:
+            records = json.load(f)
+        assert records == sample_data.to_dict(orient="records")
+
+    def test_export_parquet(self, interpreter, sample_data, tmp_path):
+        """Test Parquet export round-trips data without the index."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "out.parquet"
+        program = {
+            "pipeline": [
+                {"task": "export", "file_path": str(path), "format": "parquet"}
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data.iloc[::-1])
+
+        assert not result.errors
+        exported = pd.read_parquet(path)
+        assert list(exported.columns) == list(sample_data.columns)
+        assert exported["name"].tolist() == sample_data["name"].tolist()[::-1]
+
 
 class TestModelCallTask:
     """Test model call task functionality."""
@@ -230,6 +593,171 @@ class TestModelCallTask:
         assert "analysis" in result.data.columns
         assert all("Analyze this score:" in str(x) for x in result.data["analysis"])
 
+    def test_simulate_repeated_values(self, interpreter, sample_data):
+        """Test simulated calls on enum-like and categorical columns."""
+        program = {
+            "pipeline": [
+                {
+                    "task": "model_call",
+                    "prompt": "Classify:",
+                    "input_field": "status",
+                    "output_field": "label",
+                }
+            ]
+        }
+        expected = [f"[AI: Classify:] {status}" for status in sample_data["status"]]
+
+        for status in (
+            sample_data["status"],
+            sample_data["status"].astype("category"),
+        ):
+            data = sample_data.assign(status=status)
+            result = interpreter.execute(program, data)
+
+            assert not result.errors
+            assert result.data["label"].tolist() == expected
+
+    def test_simulate_mixed_object_values(self, interpreter):
+        """Test that equal-hashing values of different types format apart."""
+        values = [1, True, 1.0, 1, True, 1.0, 1, True]
+        data = pd.DataFrame({"x": pd.Series(values, dtype=object)})
+        program = {
+            "pipeline": [{"task": "model_call", "prompt": "P", "input_field": "x"}]
+        }
+
+        result = interpreter.execute(program, data)
+
+        assert not result.errors
+        assert result.data["model_output"].tolist() == [
+            f"[AI: P] {value}" for value in values
+        ]
+
+    def test_batched_api_calls_keep_order(self, interpreter, sample_data, monkeypatch):
+        """Test concurrent API calls return outputs in row order."""
+        from aion.tasks.model_call import ModelCallHandler, clear_response_cache
+
+        clear_response_cache()
+
+        def fake_call(self, prompt, input_text, model):
+            if input_text == "Bob":
+                raise RuntimeError("boom")
+            return input_text.upper()
+
+        monkeypatch.setattr(ModelCallHandler, "call_openai", fake_call)
+        program = {
+            "pipeline": [
+                {
+                    "task": "model_call",
+                    "prompt": "Shout:",
+                    "input_field": "name",
+                    "output_field": "shout",
+                    "provider": "openai",
+                    "max_concurrency": 2,
+                }
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        expected = [
+            "[Error: boom]" if name == "Bob" else name.upper()
+            for name in sample_data["name"]
+        ]
+        assert result.data["shout"].tolist() == expected
+
+    def test_responses_cached(self, interpreter, sample_data, monkeypatch):
+        """Test duplicate inputs are sent once, within and across runs."""
+        from aion.tasks.model_call import ModelCallHandler, clear_response_cache
+
+        calls = []
+
+        def fake_call(self, prompt, input_text, model):
+            calls.append(input_text)
+            return f"<{input_text}>"
+
+        clear_response_cache()
+        monkeypatch.setattr(ModelCallHandler, "call_anthropic", fake_call)
+        program = {
+            "pipeline": [
+                {
+                    "task": "model_call",
+                    "prompt": "Classify:",
+                    "input_field": "status",
+                    "output_field": "label",
+                    "provider": "anthropic",
+                }
+            ]
+        }
+
+        first = interpreter.execute(program, sample_data)
+        second = interpreter.execute(program, sample_data)
+
+        assert sorted(calls) == ["active", "inactive"]
+        expected = [f"<{status}>" for status in sample_data["status"]]
+        assert first.data["label"].tolist() == expected
+        assert second.data["label"].tolist() == expected
+
+    def test_prompt_batching(self, interpreter, sample_data, monkeypatch):
+        """Test several inputs per request, with per-input retry on bad JSON."""
+        from aion.tasks.model_call import ModelCallHandler, clear_response_cache
+
+        requests = []
+
+        def fake_call(self, prompt, input_text, model, **kwargs):
+            requests.append(input_text)
+            if not kwargs.get("json_output"):
+                return input_text.upper()
+            items = [line.split(". ", 1)[1] for line in input_text.split("\n")]
+            if "Eve" in items:
+                return "not json"
+            return json.dumps({"outputs": [item.upper() for item in items]})
+
+        clear_response_cache()
+        monkeypatch.setattr(ModelCallHandler, "call_openai", fake_call)
+        program = {
+            "pipeline": [
+                {
+                    "task": "model_call",
+                    "prompt": "Shout:",
+                    "input_field": "name",
+                    "output_field": "shout",
+                    "provider": "openai",
+                    "batch_size": 3,
+                }
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        assert result.data["shout"].tolist() == [
+            name.upper() for name in sample_data["name"]
+        ]
+        # One batch of three, then a failed batch of two retried per input
+        assert len(requests) == 4
+
+    def test_invalid_max_concurrency(self, interpreter, sample_data):
+        """Test that max_concurrency must be a positive integer."""
+        program = {
+            "pipeline": [{"task": "model_call", "prompt": "p", "max_concurrency": 0}]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert result.errors
+        assert "max_concurrency" in result.errors[0]
+
+    def test_float_integer_options_rejected(self, interpreter, sample_data):
+        """Test that integral floats are rejected like the hand-written check."""
+        for key in ("max_concurrency", "batch_size"):
+            program = {"pipeline": [{"task": "model_call", "prompt": "p", key: 2.0}]}
+
+            result = interpreter.execute(program, sample_data)
+
+            assert result.errors
+            assert key in result.errors[0]
+
 
 class TestPipelineExecution:
     """Test multi-step pipeline execution."""
@@ -265,6 +793,309 @@ class TestPipelineExecution:
         assert "performance" in result.data.columns
         assert result.data["score"].iloc[0] == 95  # Highest score first
 
+    def test_filter_pushdown(self, interpreter, sample_data):
+        """Test that filters run early without changing the output."""
+        sort = {"task": "sort", "operation": {"field": "score", "order": "desc"}}
+        rename = {"task": "transform", "mapping": {"full_name": "name"}}
+        filter_age = {
+            "task": "filter",
+            "condition": {"field": "age", "operator": ">", "value": 30},
+        }
+        filter_name = {
+            "task": "filter",
+            "condition": {"field": "full_name", "operator": "!=", "value": "Eve"},
+        }
+
+        result = interpreter.execute(
+            {"pipeline": [sort, filter_age, rename, filter_name]}, sample_data
+        )
+        expected = sample_data[(sample_data["age"] > 30)]
+        expected = expected[expected["name"] != "Eve"]
+        expected = expected.sort_values("score", ascending=False)
+        expected = expected.assign(full_name=expected["name"]).drop(columns="name")
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected)
+        # The age filter runs before the sort; the name filter stays after
+        # the rename
+        executed = [step["task_index"] for step in result.execution_plan]
+        assert executed == [1, 0, 2, 3]
+
+    def test_filter_not_pushed_past_transform(self, interpreter, sample_data):
+        """Test that a filter removing every row keeps the transform's columns."""
+        program = {
+            "pipeline": [
+                {"task": "transform", "mapping": {"full_name": "name"}},
+                {
+                    "task": "filter",
+                    "condition": {"field": "age", "operator": ">", "value": 100},
+                },
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        assert result.data.empty
+        assert list(result.data.columns) == [
+            "id",
+            "age",
+            "status",
+            "score",
+            "full_name",
+        ]
+
+    def test_adjacent_filters_fused(self, interpreter, sample_data):
+        """Test that adjacent filters run as one step with the same output."""
+        filters = [
+            {
+                "task": "filter",
+                "condition": {"field": "age", "operator": ">", "value": 25},
+            },
+            {
+                "task": "filter",
+                "condition": {"field": "status", "operator": "==", "value": "active"},
+            },
+        ]
+
+        result = interpreter.execute({"pipeline": filters}, sample_data)
+
+        assert not result.errors
+        assert result.data["name"].tolist() == ["Charlie", "David"]
+        assert "Executing task 1, 2/2: filter" in result.logs
+        assert [step["task_config"] for step in result.execution_plan] == filters
+
+    def test_fused_filter_failure(self, interpreter, sample_data):
+        """Test that a failing fused filter is reported against its own task."""
+        program = {
+            "pipeline": [
+                {
+                    "task": "filter",
+                    "condition": {"field": "age", "operator": ">", "value": 25},
+                },
+                {
+                    "task": "filter",
+                    "condition": {"field": "missing", "operator": "==", "value": 1},
+                },
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert result.errors == [
+            "Task filter failed: Field 'missing' not found in data"
+        ]
+        assert [step["success"] for step in result.execution_plan] == [True, False]
+        assert result.execution_plan[1]["task_index"] == 1
+
+    def test_custom_handlers_not_rewritten(self, interpreter, sample_data):
+        """Test that user-registered filters run as written."""
+        seen = []
+
+        def custom_filter(data, task):
+            seen.append(task["condition"]["field"])
+            return data
+
+        interpreter.registry.register("filter", custom_filter)
+        program = {
+            "pipeline": [
+                {"task": "sort", "operation": {"field": "age"}},
+                {
+                    "task": "filter",
+                    "condition": {"field": "age", "operator": ">", "value": 25},
+                },
+                {
+                    "task": "filter",
+                    "condition": {"field": "score", "operator": ">", "value": 80},
+                },
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        assert seen == ["age", "score"]
+        assert [step["task_index"] for step in result.execution_plan] == [0, 1, 2]
+
+    def test_empty_pipeline(self, interpreter, sample_data):
+        """Test that an empty pipeline returns the input untouched."""
+        result = interpreter.execute({"pipeline": []}, sample_data)
+
+        assert not result.errors
+        assert result.data is sample_data
+
+        result = interpreter.execute({"pipeline": []})
+
+        assert not result.errors
+        assert result.logs == ["Program validation passed"]
+        assert isinstance(result.data, pd.DataFrame) and result.data.empty
+
+    def test_validation_cached(self, interpreter, sample_data, monkeypatch):
+        """Test that re-running an identical program skips validation."""
+        program = {"pipeline": [{"task": "sort", "operation": {"field": "age"}}]}
+        interpreter.execute(program, sample_data)
+
+        def fail(program):
+            raise AssertionError("program validated twice")
+
+        monkeypatch.setattr(interpreter.validator, "compile_program", fail)
+        result = interpreter.execute(
+            {"pipeline": [{"operation": {"field": "age"}, "task": "sort"}]},
+            sample_data,
+        )
+
+        assert not result.errors
+
+    def test_validation_cache_bounded(self, interpreter, sample_data, monkeypatch):
+        """Test that the validation cache evicts least recently used programs."""
+        from aion.core import interpreter as interpreter_module
+
+        monkeypatch.setattr(interpreter_module, "PROGRAM_CACHE_SIZE", 2)
+        programs = [
+            {"pipeline": [{"task": "sort", "operation": {"field": field}}]}
+            for field in ("age", "score", "id")
+        ]
+
+        interpreter.execute(programs[0], sample_data)
+        interpreter.execute(programs[1], sample_data)
+        interpreter.execute(programs[0], sample_data)
+        interpreter.execute(programs[2], sample_data)
+
+        keys = [interpreter_module._program_key(p) for p in programs]
+        assert list(interpreter._typed) == [keys[0], keys[2]]
+
+    def test_plan_cached(self, interpreter, sample_data, monkeypatch):
+        """Test that plans are reused until a handler is registered."""
+        from aion.core import interpreter as interpreter_module
+
+        program = {
+            "pipeline": [
+                {"task": "sort", "operation": {"field": "age"}},
+                {
+                    "task": "filter",
+                    "condition": {"field": "age", "operator": ">", "value": 25},
+                },
+            ]
+        }
+        interpreter.execute(program, sample_data)
+
+        plan_pipeline = interpreter_module._plan_pipeline
+        planned = []
+
+        def record(pipeline, builtin, sortable):
+            planned.append(builtin)
+            return plan_pipeline(pipeline, builtin, sortable)
+
+        monkeypatch.setattr(interpreter_module, "_plan_pipeline", record)
+        result = interpreter.execute(program, sample_data)
+
+        assert not planned
+        assert [step["task_index"] for step in result.execution_plan] == [1, 0]
+
+        interpreter.registry.register("filter", lambda data, task: data)
+        result = interpreter.execute(program, sample_data)
+
+        assert len(planned) == 1
+        assert [step["task_index"] for step in result.execution_plan] == [0, 1]
+
+    def test_filter_not_moved_past_failing_sort(self, interpreter, sample_data):
+        """Test that a sort on a missing field still fails before a filter."""
+        program = {
+            "pipeline": [
+                {"task": "sort", "operation": {"field": "missing"}},
+                {
+                    "task": "filter",
+                    "condition": {"field": "score", "operator": "<=", "value": 35.5},
+                },
+            ]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert result.errors
+        assert "Field 'missing' not found" in result.errors[0]
+
+    def test_plan_cache_bounded(self, interpreter, sample_data, monkeypatch):
+        """Test that the plan cache keeps only recently used programs."""
+        from aion.core import interpreter as interpreter_module
+
+        monkeypatch.setattr(interpreter_module, "PROGRAM_CACHE_SIZE", 2)
+        for value in range(5):
+            program = {
+                "pipeline": [
+                    {
+                        "task": "filter",
+                        "condition": {"field": "age", "operator": ">", "value": value},
+                    }
+                ]
+            }
+            interpreter.execute(program, sample_data)
+
+        assert len(interpreter._plans) == 2
+        assert next(reversed(interpreter._plans))[0] == (
+            interpreter_module._program_key(program)
+        )
+
+    def test_noop_tasks_pruned(self, interpreter, sample_data):
+        """Test that empty transforms and overridden sorts are skipped."""
+        from aion.core.interpreter import _prune_pipeline
+
+        program = {
+            "pipeline": [
+                {"task": "transform", "mapping": {}},
+                {"task": "sort", "operation": {"field": "age", "order": "asc"}},
+                {"task": "sort", "operation": {"field": "age", "order": "desc"}},
+                {"task": "sort", "operation": {"field": "score"}},
+            ]
+        }
+        builtin = frozenset({"transform", "sort"})
+
+        assert _prune_pipeline(program["pipeline"], builtin) == {0, 1}
+        assert _prune_pipeline(program["pipeline"][1:], builtin) == {0}
+        assert _prune_pipeline(program["pipeline"], frozenset()) == frozenset()
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        assert [step["task_index"] for step in result.execution_plan] == [0, 1, 2, 3]
+        assert result.data["score"].tolist() == [78, 85, 88, 92, 95]
+
+    def test_use_arrow(self, sample_data):
+        """Test that object string columns run on Arrow-backed strings."""
+        pytest.importorskip("pyarrow")
+        data = sample_data.astype({"status": object}).assign(
+            flag=pd.Series([True, False, True, None, False], dtype=object),
+            mixed=pd.Series([1, "a", 2, "b", 3], dtype=object),
+        )
+        program = {
+            "pipeline": [
+                {
+                    "task": "filter",
+                    "condition": {
+                        "field": "status",
+                        "operator": "==",
+                        "value": "active",
+                    },
+                }
+            ]
+        }
+
+        result = AIONInterpreter(use_arrow=True).execute(program, data)
+
+        assert not result.errors
+        assert result.data["id"].tolist() == [1, 3, 4]
+        assert isinstance(result.data["status"].dtype, pd.ArrowDtype)
+        assert result.data["age"].dtype == sample_data["age"].dtype
+        assert result.data["flag"].dtype == object
+        assert result.data["mixed"].tolist() == [1, 2, "b"]
+
+    def test_registries_are_independent(self, interpreter):
+        """Test that custom handlers do not leak into other interpreters."""
+        interpreter.registry.register("custom", lambda data, task: data)
+
+        assert not AIONInterpreter().registry.has_task("custom")
+        assert AIONInterpreter().registry.has_task("filter")
+
 
 class TestErrorHandling:
     """Test error handling and validation."""
@@ -287,6 +1118,28 @@ class TestErrorHandling:
         assert result.errors
         assert "Unknown task type" in result.errors[0]
 
+    def test_tuple_group_by_rejected(self, sample_data, monkeypatch):
+        """Test that schema and hand-written checks both reject tuples."""
+        program = {
+            "pipeline": [
+                {
+                    "task": "aggregate",
+                    "group_by": ("status",),
+                    "aggregations": {"score": "sum"},
+                }
+            ]
+        }
+
+        with_schemas = AIONInterpreter()
+        without_schemas = AIONInterpreter()
+        monkeypatch.setattr(without_schemas.validator, "_validators", {})
+
+        for interpreter in (with_schemas, without_schemas):
+            result = interpreter.execute(program, sample_data)
+
+            assert result.errors
+            assert "Group by must be a list" in result.errors[0]
+
     def test_missing_task_config(self, interpreter, sample_data):
         """Test handling of missing task configuration."""
         program = {
@@ -303,6 +1156,25 @@ class TestErrorHandling:
         assert result.errors
         assert "condition" in result.errors[0]
 
+    def test_invalid_sort_order(self, interpreter, sample_data):
+        """Test that schema failures report the specific validation error."""
+        program = {
+            "pipeline": [{"task": "sort", "operation": {"field": "age", "order": "up"}}]
+        }
+
+        result = interpreter.execute(program, sample_data)
+
+        assert result.errors
+        assert "Sort order must be 'asc' or 'desc'" in result.errors[0]
+
+    def test_export_format_case_insensitive(self, interpreter):
+        """Test that tasks failing only the strict schema are still valid."""
+        program = {
+            "pipeline": [{"task": "export", "file_path": "out.csv", "format": "CSV"}]
+        }
+
+        assert interpreter.validator.validate_program(program) == []
+
 
 class TestExplainFunctionality:
     """Test program explanation functionality."""
@@ -347,3 +1219,389 @@ class TestExplainFunctionality:
         assert "FILTER" in explanation
         assert "SORT" in explanation
         assert "TRANSFORM" in explanation
+
+    def test_explain_after_execute(self, interpreter, sample_data):
+        """Test that explain reuses the typed pipeline from validation."""
+        program = {
+            "pipeline": [
+                {"task": "sort", "operation": {"field": "score"}},
+                {"task": "model_call", "prompt": "Summarize"},
+            ]
+        }
+        expected = AIONInterpreter().explain(program)
+
+        interpreter.execute(program, sample_data)
+        errors, typed = interpreter.validator.compile_program(program)
+
+        assert interpreter.explain(program) == expected
+        assert not errors
+        assert [(t.field, t.order) for t in typed] == [("score", "asc"), (None, None)]
+        assert "Sorts data by score in ascending order" in expected
+
+
+class TestPolarsBackend:
+    """Test the lazy polars execution backend."""
+
+    def test_invalid_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown backend"):
+            AIONInterpreter(backend="spark")
+
+    def test_matches_pandas_backend(self, interpreter, sample_data):
+        """Test that the lazy plan produces the same data as pandas."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        program = {
+            "pipeline": [
+                {
+                    "task": "filter",
+                    "condition": {"field": "age", "operator": ">=", "value": 30},
+                },
+                {"task": "sort", "operation": {"field": "score", "order": "desc"}},
+                {
+                    "task": "transform",
+                    "mapping": {
+                        "user_id": "id",
+                        "performance": {"concat": ["name", " - Score: ", "score"]},
+                    },
+                },
+            ]
+        }
+
+        expected = interpreter.execute(program, sample_data)
+        result = AIONInterpreter(backend="polars").execute(program, sample_data)
+
+        assert not result.errors
+        assert "polars" in result.logs[1]
+        assert list(result.data.columns) == list(expected.data.columns)
+        assert result.data["performance"].tolist() == (
+            expected.data["performance"].tolist()
+        )
+        assert result.data["user_id"].tolist() == expected.data["user_id"].tolist()
+
+        # Groups with missing values, and pipelines that leave no rows
+        data = pd.DataFrame(
+            {
+                "status": ["a", "a", "b", "b"],
+                "f": [None, 0.0, None, None],
+                "g": [1, 2, 3, 4],
+            }
+        )
+        for func in ("first", "last", "nunique", "count", "sum", "mean"):
+            for value in (0, 99):
+                program = {
+                    "pipeline": [
+                        {
+                            "task": "filter",
+                            "condition": {
+                                "field": "g",
+                                "operator": ">",
+                                "value": value,
+                            },
+                        },
+                        {
+                            "task": "aggregate",
+                            "group_by": ["status"],
+                            "aggregations": {"f": func},
+                        },
+                    ]
+                }
+
+                expected = interpreter.execute(program, data)
+                result = AIONInterpreter(backend="polars").execute(program, data)
+
+                assert not result.errors
+                pd.testing.assert_frame_equal(result.data, expected.data)
+
+    def test_arithmetic_expression(self, interpreter, sample_data):
+        """Test that arithmetic transforms run in the polars query."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        program = {
+            "pipeline": [
+                {
+                    "task": "transform",
+                    "mapping": {
+                        "weighted": {"mul": [{"add": ["score", "age"]}, 2]},
+                        "ratio": {"div": ["score", "age"]},
+                    },
+                }
+            ]
+        }
+
+        expected = interpreter.execute(program, sample_data)
+        result = AIONInterpreter(backend="polars").execute(program, sample_data)
+
+        assert not result.errors
+        assert "polars" in result.logs[1]
+        pd.testing.assert_frame_equal(result.data, expected.data, check_dtype=False)
+
+    def test_aggregate(self, sample_data):
+        """Test lowering of single-function aggregations."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        program = {
+            "pipeline": [
+                {
+                    "task": "aggregate",
+                    "group_by": ["status"],
+                    "aggregations": {"score": "sum", "age": "mean"},
+                }
+            ]
+        }
+
+        result = AIONInterpreter(backend="polars").execute(program, sample_data)
+
+        assert not result.errors
+        assert result.data["status"].tolist() == ["active", "inactive"]
+        assert result.data["score"].tolist() == [258, 180]
+
+    def test_lazy_frame_input(self, sample_data):
+        """Test that polars LazyFrame input runs with or without lowering."""
+        pl = pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        lf = pl.from_pandas(sample_data).lazy()
+        interpreter = AIONInterpreter(backend="polars")
+        sort = {"task": "sort", "operation": {"field": "age", "order": "desc"}}
+        model_call = {"task": "model_call", "prompt": "Hi", "input_field": "name"}
+
+        lowered = interpreter.execute({"pipeline": [sort]}, lf)
+        eager = interpreter.execute({"pipeline": [sort, model_call]}, lf)
+
+        assert isinstance(lowered.data, pd.DataFrame)
+        assert lowered.data["age"].iloc[0] == 45
+        assert isinstance(eager.data, pd.DataFrame)
+        assert eager.data["model_output"].iloc[0] == "[AI: Hi] Eve"
+
+    def test_not_equal_and_bool_concat_match_pandas(self, interpreter):
+        """Test that != keeps missing values and booleans concat as True."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        data = pd.DataFrame(
+            {"score": [1.0, float("nan"), 3.0], "flag": [True, False, True]}
+        )
+        program = {
+            "pipeline": [
+                {
+                    "task": "filter",
+                    "condition": {"field": "score", "operator": "!=", "value": 1.0},
+                },
+                {
+                    "task": "transform",
+                    "mapping": {"label": {"concat": ["flag", " - ", "score"]}},
+                },
+            ]
+        }
+
+        expected = interpreter.execute(program, data)
+        result = AIONInterpreter(backend="polars").execute(program, data)
+
+        assert "polars" in result.logs[1]
+        assert len(result.data) == len(expected.data) == 2
+        assert result.data["flag"].tolist() == expected.data["flag"].tolist()
+        assert result.data["label"].iloc[1] == expected.data["label"].iloc[1]
+        assert result.data["label"].iloc[1] == "True - 3.0"
+
+    def test_custom_handler_skips_polars(self, sample_data):
+        """Test that user-registered handlers run on the pandas path."""
+        pytest.importorskip("polars")
+        interpreter = AIONInterpreter(backend="polars")
+        interpreter.registry.register("sort", lambda data, task: data.head(1))
+        program = {"pipeline": [{"task": "sort", "operation": {"field": "age"}}]}
+
+        result = interpreter.execute(program, sample_data)
+
+        assert not result.errors
+        assert len(result.data) == 1
+
+    def test_empty_pipeline_collects_lazy_input(self, sample_data):
+        """Test that an empty pipeline returns LazyFrame input as pandas."""
+        pl = pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        lf = pl.from_pandas(sample_data).lazy()
+
+        result = AIONInterpreter(backend="polars").execute({"pipeline": []}, lf)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, sample_data, check_dtype=False)
+
+    def test_cli_example_matches_pandas(self, tmp_path, monkeypatch):
+        """Test the advanced example pipeline on CSV input loaded for polars."""
+        pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        examples = os.path.join(os.path.dirname(__file__), "..", "examples")
+        program = load_program(os.path.join(examples, "advanced_pipeline.json"))
+        csv_path = os.path.join(examples, "sample_data.csv")
+        monkeypatch.chdir(tmp_path)
+
+        data = load_data(csv_path, engine="polars")
+        expected = AIONInterpreter().execute(program, load_data(csv_path))
+        result = AIONInterpreter(backend="polars").execute(program, data)
+
+        assert isinstance(data, pd.DataFrame)
+
+        assert not result.errors
+        pd.testing.assert_frame_equal(result.data, expected.data)
+
+    def test_falls_back_to_pandas(self, sample_data):
+        """Test that unsupported tasks run on the pandas backend."""
+        program = {
+            "pipeline": [
+                {
+                    "task": "model_call",
+                    "prompt": "Analyze this score:",
+                    "input_field": "score",
+                    "output_field": "analysis",
+                },
+                {
+                    "task": "filter",
+                    "condition": {"field": "missing", "operator": ">", "value": 1},
+                },
+            ]
+        }
+
+        result = AIONInterpreter(backend="polars").execute(program, sample_data)
+
+        assert result.errors
+        assert "not found in data" in result.errors[0]
+
+
+class TestFusedKernel:
+    """Test fused numba execution of numeric filter/rename chains."""
+
+    PROGRAM = {
+        "pipeline": [
+            {
+                "task": "filter",
+                "condition": {"field": "age", "operator": ">", "value": 25},
+            },
+            {"task": "transform", "mapping": {"years": "age"}},
+            {
+                "task": "filter",
+                "condition": {"field": "years", "operator": "<=", "value": 40},
+            },
+            {
+                "task": "filter",
+                "condition": {"field": "score", "operator": "!=", "value": 78},
+            },
+        ]
+    }
+
+    def test_fuse_numeric_pipeline(self):
+        """Test that renamed fields resolve to input columns."""
+        pytest.importorskip("numba")
+        from aion.core.jit_fuser import fuse_numeric_pipeline
+
+        fused = fuse_numeric_pipeline(self.PROGRAM["pipeline"])
+
+        assert fused.columns == ("age", "score")
+        assert fused.conditions == ((0, ">"), (0, "<="), (1, "!="))
+
+    def test_not_fusible(self):
+        """Test that non-numeric pipelines are left to the task loop."""
+        from aion.core.jit_fuser import fuse_numeric_pipeline
+
+        pipeline = [
+            {
+                "task": "filter",
+                "condition": {"field": "status", "operator": "==", "value": "x"},
+            },
+            {"task": "sort", "operation": {"field": "age"}},
+        ]
+
+        assert fuse_numeric_pipeline(pipeline) is None
+
+    def test_matches_task_loop(self, interpreter, sample_data, monkeypatch):
+        """Test that the fused kernel matches task-by-task execution."""
+        pytest.importorskip("numba")
+        from aion.core import jit_fuser
+
+        expected = interpreter.execute(self.PROGRAM, sample_data)
+        monkeypatch.setattr(jit_fuser, "MIN_ROWS", 0)
+        result = AIONInterpreter(fuse_numeric=True).execute(self.PROGRAM, sample_data)
+
+        assert not result.errors
+        assert "fused kernel" in result.logs[1]
+        pd.testing.assert_frame_equal(result.data, expected.data)
+
+    def test_opt_in(self, interpreter, sample_data, monkeypatch):
+        """Test that the fused kernel only runs when requested."""
+        pytest.importorskip("numba")
+        from aion.core import jit_fuser
+
+        monkeypatch.setattr(jit_fuser, "MIN_ROWS", 0)
+        result = interpreter.execute(self.PROGRAM, sample_data)
+
+        assert not result.errors
+        assert not any("fused kernel" in log for log in result.logs)
+
+    def test_custom_handlers_and_engine_not_fused(self, sample_data, monkeypatch):
+        """Test that custom filters and explicit engines skip the kernel."""
+        pytest.importorskip("numba")
+        from aion.core import jit_fuser
+
+        monkeypatch.setattr(jit_fuser, "MIN_ROWS", 0)
+        interpreter = AIONInterpreter(fuse_numeric=True)
+        seen = []
+
+        def custom_filter(data, task):
+            seen.append(task["condition"]["field"])
+            return data
+
+        interpreter.registry.register("filter", custom_filter)
+        result = interpreter.execute(self.PROGRAM, sample_data)
+
+        assert not result.errors
+        assert seen == ["age", "years", "score"]
+
+        pipeline = [dict(task, engine="pandas") for task in self.PROGRAM["pipeline"]]
+        pipeline[1] = self.PROGRAM["pipeline"][1]
+        result = AIONInterpreter(fuse_numeric=True).execute(
+            {"pipeline": pipeline}, sample_data
+        )
+
+        assert not result.errors
+        assert not any("fused kernel" in log for log in result.logs)
+
+    def test_empty_result_matches_task_loop(self, sample_data, monkeypatch):
+        """Test that renames apply only if rows reach them when none pass."""
+        pytest.importorskip("numba")
+        from aion.core import jit_fuser
+
+        monkeypatch.setattr(jit_fuser, "MIN_ROWS", 0)
+        rename_first = {
+            "pipeline": [
+                {"task": "transform", "mapping": {"years": "age"}},
+                {
+                    "task": "filter",
+                    "condition": {"field": "years", "operator": ">", "value": 100},
+                },
+                {
+                    "task": "filter",
+                    "condition": {"field": "score", "operator": ">", "value": 0},
+                },
+            ]
+        }
+        rename_last = {
+            "pipeline": [
+                {
+                    "task": "filter",
+                    "condition": {"field": "age", "operator": ">", "value": 100},
+                },
+                {
+                    "task": "filter",
+                    "condition": {"field": "score", "operator": ">", "value": 0},
+                },
+                {"task": "transform", "mapping": {"years": "age"}},
+            ]
+        }
+
+        for program in (rename_first, rename_last):
+            expected = AIONInterpreter().execute(program, sample_data)
+            result = AIONInterpreter(fuse_numeric=True).execute(program, sample_data)
+
+            assert not result.errors
+            assert result.data.empty
+            assert list(result.data.columns) == list(expected.data.columns)
+
+        assert "age" in result.data.columns